@@ -3,8 +3,24 @@ import os
 from typing import Optional
 
 from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QProgressBar, QVBoxLayout
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, pyqtSignal, QEasingCurve
-from PyQt6.QtGui import QFont, QFontDatabase
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QFontDatabase, QFontMetrics, QRegion
+
+# Style constants shared by every overlay instance, built once at import.
+LABEL_QSS = "color: white; background: transparent;"
+PROGRESS_BAR_QSS = """
+    QProgressBar {
+        background-color: rgba(255, 255, 255, 0.1);
+        border: 4px solid white;
+        border-radius: 0px;  /* pixel style */
+    }
+    QProgressBar::chunk {
+        background-color: white;
+        border-radius: 0px;
+        margin: 0px;
+    }
+"""
+
 
 class PixelLoadingOverlay(QWidget):
     """A pixel-style loading overlay widget that displays animated text and a progress bar.
@@ -13,6 +29,9 @@ class PixelLoadingOverlay(QWidget):
     and a progress bar that fills over a set duration. When the animation
     completes, it automatically fades out and emits a `finished` signal.
 
+    All three effects are driven by one QTimer tick instead of separate
+    QPropertyAnimation/QTimer objects, so only a single timer fires per frame.
+
     Attributes:
         finished (pyqtSignal): Emitted when the loading animation finishes and fades out.
         duration_ms (int): Total duration of the progress bar animation in milliseconds.
@@ -23,6 +42,9 @@ class PixelLoadingOverlay(QWidget):
 
     finished = pyqtSignal()
 
+    TICK_MS = 25           # single animation tick (40 fps)
+    TYPE_INTERVAL_MS = 200 # milliseconds per typed character
+
     def __init__(self, duration_ms: int, text: str = "LOADING...", font_path: Optional[str] = None) -> None:
         """Initializes the PixelLoadingOverlay with the given duration and text.
 
@@ -64,29 +86,32 @@ class PixelLoadingOverlay(QWidget):
         layout.setContentsMargins(60, 60, 60, 60)
 
         # --- Typing label ---
-        self.label = QLabel("", self)
+        # The full text is set once so the label is laid out at its final
+        # size; the typing effect only widens a clip mask over it instead of
+        # re-rendering the text every character.
+        self.label = QLabel(self.full_text, self)
         self.label.setFont(self.pixel_font)
-        self.label.setStyleSheet("color: white; background: transparent;")
+        self.label.setStyleSheet(LABEL_QSS)
         layout.addWidget(self.label, alignment=Qt.AlignmentFlag.AlignCenter)
 
+        # Pixel width of each prefix of the text, computed once.
+        metrics = QFontMetrics(self.pixel_font)
+        self._prefix_widths = [
+            metrics.horizontalAdvance(self.full_text[:i])
+            for i in range(len(self.full_text) + 1)
+        ]
+        # Start genuinely clipped: an empty QRegion would *clear* the mask
+        # (Qt treats it like clearMask), flashing the full text until the
+        # first character tick. A 1px-wide strip hides the text until then.
+        self.label.setMask(QRegion(0, 0, 1, self.label.height()))
+
         # --- Progress bar ---
         self.progress = QProgressBar(self)
         self.progress.setRange(0, 100)
         self.progress.setValue(0)
         self.progress.setTextVisible(False)
         self.progress.setFixedSize(600, 32)
-        self.progress.setStyleSheet("""
-            QProgressBar {
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 4px solid white;
-                border-radius: 0px;  /* pixel style */
-            }
-            QProgressBar::chunk {
-                background-color: white;
-                border-radius: 0px;
-                margin: 0px;
-            }
-        """)
+        self.progress.setStyleSheet(PROGRESS_BAR_QSS)
         layout.addWidget(self.progress, alignment=Qt.AlignmentFlag.AlignCenter)
 
         # --- Center the overlay ---
@@ -97,11 +122,11 @@ class PixelLoadingOverlay(QWidget):
             (screen.height() - self.height()) // 2
         )
 
-        # --- Animation and timer placeholders ---
-        self.fade_in_anim: Optional[QPropertyAnimation] = None
-        self.fade_out_anim: Optional[QPropertyAnimation] = None
-        self.typing_timer: Optional[QTimer] = None
-        self.progress_anim: Optional[QPropertyAnimation] = None
+        # --- Animation state ---
+        self.tick_timer: Optional[QTimer] = None
+        self._elapsed_ms: int = 0
+        self._fade_out_start_ms: Optional[int] = None
+        self._finished: bool = False
 
         # --- Start all animations ---
         self.start_animation()
@@ -112,73 +137,69 @@ class PixelLoadingOverlay(QWidget):
         """Starts the fade-in, typing, and progress animations."""
         self.setWindowOpacity(0.0)
 
-        # Fade in animation
-        self.fade_in_anim = QPropertyAnimation(self, b"windowOpacity", self)
-        self.fade_in_anim.setDuration(self.fade_duration_ms)
-        self.fade_in_anim.setStartValue(0.0)
-        self.fade_in_anim.setEndValue(1.0)
-        self.fade_in_anim.start()
-
-        # Typing animation
         self.char_index = 0
-        self.typing_timer = QTimer(self)
-        self.typing_timer.timeout.connect(self.type_next_char)
-        self.typing_timer.start(200)
-
-        # Progress bar animation
-        self.progress_anim = QPropertyAnimation(self.progress, b"value", self)
-        self.progress_anim.setDuration(self.duration_ms)
-        self.progress_anim.setStartValue(0)
-        self.progress_anim.setEndValue(100)
-        self.progress_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.progress_anim.finished.connect(self.fade_out)
-        self.progress_anim.start()
+        self._elapsed_ms = 0
+        self._fade_out_start_ms = None
 
-    # ---------------------------------------------------------------------
+        # One timer drives fade, typing, and progress from the elapsed time.
+        self.tick_timer = QTimer(self)
+        self.tick_timer.timeout.connect(self._tick)
+        self.tick_timer.start(self.TICK_MS)
 
-    def type_next_char(self) -> None:
-        """Displays the next character in the typing animation."""
-        if self.char_index < len(self.full_text):
-            current_text = self.full_text[:self.char_index + 1]
-            self.char_index += 1
-            self.label.setText(current_text)
-        else:
-            if self.typing_timer is not None and self.typing_timer.isActive():
-                self.typing_timer.stop()
+    # ---------------------------------------------------------------------
 
+    def _tick(self) -> None:
+        """Advances every animation from the shared elapsed-time counter."""
+        self._elapsed_ms += self.TICK_MS
+        elapsed = self._elapsed_ms
+
+        if self._fade_out_start_ms is not None:
+            # Fade-out phase
+            progress = (elapsed - self._fade_out_start_ms) / self.fade_duration_ms
+            if progress >= 1.0:
+                self.setWindowOpacity(0.0)
+                self._on_fade_finished()
+            else:
+                self.setWindowOpacity(1.0 - progress)
+            return
+
+        # Fade in
+        self.setWindowOpacity(min(1.0, elapsed / self.fade_duration_ms))
+
+        # Typing effect: widen the clip mask to the next character boundary
+        chars = min(len(self.full_text), elapsed // self.TYPE_INTERVAL_MS)
+        if chars != self.char_index:
+            self.char_index = chars
+            self.label.setMask(
+                QRegion(0, 0, self._prefix_widths[chars], self.label.height())
+            )
+
+        # Progress bar, with the same OutCubic easing the old animation used
+        fraction = min(1.0, elapsed / self.duration_ms)
+        eased = 1.0 - (1.0 - fraction) ** 3
+        self.progress.setValue(int(eased * 100))
+
+        if fraction >= 1.0:
+            self.fade_out()
 
     # ---------------------------------------------------------------------
 
     def fade_out(self) -> None:
         """Triggers a fade-out effect after the animation finishes."""
-        if self.typing_timer and self.typing_timer.isActive():
-            self.typing_timer.stop()
-
-        if self.fade_out_anim:
-            self.fade_out_anim.stop()
-            self.fade_out_anim.deleteLater()
-
-        self.fade_out_anim = QPropertyAnimation(self, b"windowOpacity", self)
-        self.fade_out_anim.setDuration(self.fade_duration_ms)
-        self.fade_out_anim.setStartValue(1.0)
-        self.fade_out_anim.setEndValue(0.0)
-        self.fade_out_anim.finished.connect(self._on_fade_finished)
-        self.fade_out_anim.start()
+        if self._fade_out_start_ms is None:
+            self.label.clearMask()  # reveal any untyped remainder
+            self._fade_out_start_ms = self._elapsed_ms
 
     # ---------------------------------------------------------------------
 
     def _on_fade_finished(self) -> None:
         """Cleans up resources and emits the `finished` signal."""
-        for anim in [self.fade_in_anim, self.fade_out_anim, self.progress_anim]:
-            if anim:
-                try:
-                    anim.stop()
-                    anim.deleteLater()
-                except Exception:
-                    pass
-
-        if self.typing_timer and self.typing_timer.isActive():
-            self.typing_timer.stop()
+        if self._finished:
+            return
+        self._finished = True
+
+        if self.tick_timer is not None and self.tick_timer.isActive():
+            self.tick_timer.stop()
 
         self.close()
         self.finished.emit()
@@ -1,12 +1,43 @@
+import logging
+import os
+import sys
+
 import rumps
 import subprocess
 import threading
-
 import time
-from typing import Optional
+
+from datetime import date
+from typing import Optional, Set
 
 from task_manager import TaskManager
-from utils.background import start_background_notifier
+from utils.background import promote_to_utility_qos
+from utils.helpers import notify_due_tasks, next_due_date
+
+# Directory this app lives in, so child processes are launched with the
+# right interpreter and absolute script paths regardless of cwd/PATH.
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Module logger: unlike print, messages are dropped for free unless a
+# handler/level is configured, so the poll loop does no I/O by default.
+logger = logging.getLogger(__name__)
+
+
+def _spawn_detached(script_name: str) -> None:
+    """Launch one of our scripts in its own session without forking.
+
+    os.posix_spawn skips the fork page-table copy that subprocess.Popen
+    pays on macOS, so launches are faster and never briefly double the
+    menu-bar process RSS. Falls back to Popen where spawn is unavailable.
+
+    Args:
+        script_name (str): Script filename relative to APP_DIR.
+    """
+    argv = [sys.executable, os.path.join(APP_DIR, script_name)]
+    try:
+        os.posix_spawn(sys.executable, argv, os.environ, setsid=True)
+    except (AttributeError, ValueError, NotImplementedError):
+        subprocess.Popen(argv, start_new_session=True)
 
 
 class TaskMenuBar(rumps.App):
@@ -19,13 +50,30 @@ class TaskMenuBar(rumps.App):
     - Quit the app from the menu bar.
     """
 
-    def __init__(self) -> None:
-        """Initialize the menu bar application and its attributes."""
+    POLL_INTERVAL = 120      # default base seconds between background checks
+    MAX_POLL_INTERVAL = 960  # default backoff ceiling while nothing is due
+    TOGGLE_NOTICE_DELAY = 0.3  # seconds to coalesce rapid toggle clicks
+
+    def __init__(self, poll_interval: Optional[int] = None,
+                 max_poll_interval: Optional[int] = None) -> None:
+        """Initialize the menu bar application and its attributes.
+
+        Args:
+            poll_interval (Optional[int]): Base seconds between background
+                checks. Defaults to POLL_INTERVAL.
+            max_poll_interval (Optional[int]): Backoff ceiling in seconds.
+                Defaults to MAX_POLL_INTERVAL.
+        """
         super(TaskMenuBar, self).__init__("Tasks", quit_button=None) # type: ignore
         self.manager: TaskManager = TaskManager()
+        self.poll_interval: int = poll_interval or self.POLL_INTERVAL
+        self.max_poll_interval: int = max_poll_interval or self.MAX_POLL_INTERVAL
         self.icon: str = "assets/menu_bar_icon.png"
-        self.notification_on: bool = False
         self.bg_thread: Optional[threading.Thread] = None
+        self._stop_event: threading.Event = threading.Event()      # app quitting
+        self._active: threading.Event = threading.Event()          # notifications enabled
+        self._sleep_interrupt: threading.Event = threading.Event() # cuts a sleep short
+        self._announce_timer: Optional[threading.Timer] = None     # debounces toggle banners
 
         # Define menu items displayed in the macOS menu bar.
         self.menu = [
@@ -36,6 +84,15 @@ class TaskMenuBar(rumps.App):
             "Quit",
         ]
 
+    @property
+    def notification_on(self) -> bool:
+        """bool: Whether notifications are enabled, backed by the armed event.
+
+        Threading.Event is the single, atomically-updated source of truth, so
+        the UI flag can never drift out of sync with what the loop observes.
+        """
+        return self._active.is_set()
+
     @rumps.clicked("Open CLI Task Manager")
     def open_cli(self, _: rumps.MenuItem) -> None:
         """Open the CLI version of the task manager in a new subprocess.
@@ -45,7 +102,7 @@ class TaskMenuBar(rumps.App):
                 The clicked menu item (unused, but required by the decorator).
         """
         try:
-            subprocess.Popen(["python3", "menu_cli.py"], start_new_session=True)
+            _spawn_detached("menu_cli.py")
         except FileNotFoundError:
             rumps.alert("Error", "cli.py not found. Please check the file path.")
    
@@ -58,7 +115,7 @@ class TaskMenuBar(rumps.App):
                 The clicked menu item (unused, but required by the decorator).
         """
         try:
-            subprocess.Popen(["python3", "menu_gui.py"], start_new_session=True)
+            _spawn_detached("menu_gui.py")
         except FileNotFoundError:
             rumps.alert("Error", "GUI.py not found. Please check the file path.")
 
@@ -70,33 +127,114 @@ class TaskMenuBar(rumps.App):
             sender (rumps.MenuItem): The clicked menu item that triggered the event.
         """
         if not self.notification_on:
-            self.notification_on = True
             sender.title = "Turn Off Notifications"
+
+            # Re-arm the single background thread; it is created lazily on
+            # the first toggle and parked (not torn down) when disabled.
+            self._active.set()
+            if self.bg_thread is None or not self.bg_thread.is_alive():
+                self.bg_thread = threading.Thread(target=self.notification_loop)
+                self.bg_thread.start()
+        else:
+            # Park the loop: clear the armed flag and cut any sleep short.
+            self._active.clear()
+            self._sleep_interrupt.set()
+            sender.title = "Turn On Notifications"
+
+        # Coalesce rapid clicks: only the state settled after the debounce
+        # window is announced, so click spam posts one banner instead of N.
+        if self._announce_timer is not None:
+            self._announce_timer.cancel()
+        self._announce_timer = threading.Timer(
+            self.TOGGLE_NOTICE_DELAY, self._announce_toggle_state
+        )
+        self._announce_timer.start()
+
+    def _announce_toggle_state(self) -> None:
+        """Post a single banner reflecting the current notification state."""
+        if self.notification_on:
             rumps.notification(
                 "Notifications Enabled", "", "Task reminders are now active!"
             )
-
-            # Run notification loop in the background thread
-            self.bg_thread = threading.Thread(
-                target=self.notification_loop, daemon=True
-            )
-            self.bg_thread.start()
         else:
-            self.notification_on = False
-            sender.title = "Turn On Notifications"
             rumps.notification(
                 "Notifications Disabled", "", "No reminders will be sent."
             )
 
+    def _stop_notifier(self) -> None:
+        """Signal the notifier thread to stop and wait for it to finish."""
+        if self._announce_timer is not None:
+            self._announce_timer.cancel()
+        self._stop_event.set()
+        self._active.set()          # release a parked loop so it can exit
+        self._sleep_interrupt.set() # release a sleeping loop likewise
+        if self.bg_thread is not None and self.bg_thread.is_alive():
+            self.bg_thread.join()
+        self.bg_thread = None
+
     def notification_loop(self) -> None:
-        """Run background checks for due tasks every few minutes."""
-        while self.notification_on:
+        """Run background checks for due tasks, backing off while quiet.
+
+        The loop lives for the whole app session: while notifications are
+        disabled it parks on the _active event instead of exiting, so
+        re-enabling never has to spawn a new thread. Each armed iteration
+        performs exactly one check. Quiet passes double the wait up to
+        MAX_POLL_INTERVAL; a pass that fires a notification resets it to
+        the base interval.
+        """
+        # BACKGROUND-class threads get throttled by the macOS scheduler;
+        # UTILITY keeps due-time notifications timely under system load.
+        promote_to_utility_qos()
+
+        notified: Set[str] = set()
+        wait_time = self.poll_interval
+        next_due: Optional[date] = None
+        last_scan = 0.0
+
+        while not self._stop_event.is_set():
+            if not self._active.is_set():
+                self._active.wait()  # parked until the toggle re-arms us
+                # A toggle-off while scanning can leave the interrupt set;
+                # drop it so the first armed sleep doesn't return instantly
+                # and trigger a duplicate scan.
+                self._sleep_interrupt.clear()
+                wait_time = self.poll_interval
+                next_due = None
+                if self._stop_event.is_set():
+                    break
             try:
-                print("Checking tasks in background...")
-                start_background_notifier(self.manager)
-                
-            except Exception as e:
-                print(f"[Error in notifier] {e}")
+                today = date.today()
+                if (next_due is not None
+                        and (next_due - today).days > 1
+                        and time.monotonic() - last_scan < self.max_poll_interval):
+                    # Cached next-due date says nothing can fire yet, so skip
+                    # reloading and rescanning. A full scan still happens at
+                    # least every MAX_POLL_INTERVAL to notice new tasks.
+                    wait_time = min(wait_time * 2, self.max_poll_interval)
+                else:
+                    logger.debug("Checking tasks in background...")
+                    self.manager = TaskManager()
+                    if self.manager.tasks:
+                        sent = notify_due_tasks(self.manager, notified)
+                        next_due = next_due_date(self.manager, today)
+                    else:
+                        # Nothing to check: skip the scan outright and let
+                        # the backoff stretch the polls toward the ceiling.
+                        sent = 0
+                        next_due = None
+                    last_scan = time.monotonic()
+                    wait_time = (
+                        self.poll_interval if sent
+                        else min(wait_time * 2, self.max_poll_interval)
+                    )
+
+            except Exception:
+                logger.exception("Error in notifier")
+                wait_time = self.poll_interval
+            # Sleeps like time.sleep but wakes as soon as the toggle or
+            # quit path needs the loop's attention.
+            self._sleep_interrupt.wait(wait_time)
+            self._sleep_interrupt.clear()
 
     @rumps.clicked("Quit")
     def quit_app(self, _: rumps.MenuItem) -> None:
@@ -106,6 +244,7 @@ class TaskMenuBar(rumps.App):
             _: rumps.MenuItem
                 The clicked menu item (unused).
         """
+        self._stop_notifier()
         rumps.notification("Exiting", "", "Task Manager closed.")
         rumps.quit_application()
 
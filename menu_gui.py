@@ -1,45 +1,34 @@
 import sys
-from datetime import datetime
+from datetime import datetime, date
 import os
-import functools
+import re
 
 # PyQt6
 from PyQt6.QtCore import (
-    Qt, pyqtSignal, QEasingCurve, QPoint, QTimer, QVariantAnimation,
+    Qt, pyqtSignal, pyqtSlot, QAbstractListModel, QEasingCurve, QElapsedTimer,
+    QModelIndex, QParallelAnimationGroup, QPoint, QRunnable, QThreadPool,
+    QTimer, QVariantAnimation,
     QPropertyAnimation, QUrl
 )
 
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
-    QScrollArea, QFrame, QGraphicsDropShadowEffect, QSpacerItem, QSizePolicy,
-    QGraphicsOpacityEffect, QHBoxLayout, QMessageBox, QDialog
+    QApplication, QWidget, QLabel, QLineEdit, QListView, QPushButton,
+    QVBoxLayout, QFrame, QGraphicsDropShadowEffect, QSpacerItem,
+    QSizePolicy, QHBoxLayout, QMessageBox, QDialog
 )
 
-from PyQt6.QtGui import QFont, QColor, QFontDatabase, QIcon 
+from PyQt6.QtGui import QFont, QColor, QFontDatabase, QIcon, QPainter
 
-from PyQt6.QtMultimedia import QSoundEffect
+# PyQt6.QtMultimedia is imported lazily inside load_sound: it pulls in the
+# platform audio stack, which is the heaviest part of startup after QtWidgets
+# and is only needed once the first sound effect is created.
 
 # Project
-from task_manager import TaskManager
+from task_manager import get_manager
 from task import Task
 from notifier import send_notification
 from utils.helpers import back_to_desktop
-# Assuming loading_animation is available, otherwise it defaults to basic QWidget
-try:
-    from loading_animation import PixelLoadingOverlay # type: ignore
-except ImportError:
-    class PixelLoadingOverlay(QWidget):
-        def __init__(self, duration):
-            super().__init__()
-            self.duration = duration
-            self.setWindowTitle("LOADING...")
-            self.resize(300, 100)
-            self.setStyleSheet("background-color: black;")
-            loading_label = QLabel("LOADING...", self)
-            loading_label.setFont(QFont("Menlo", 24))
-            loading_label.setStyleSheet("color: white;")
-            loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            loading_label.resize(300, 100)
+from loading_animation import PixelLoadingOverlay
 # =========================================================================
 
 import pathlib
@@ -58,26 +47,261 @@ LOADING_DURATION_MS = 3000 # 3 seconds
 # -------------------------------------------------------
 
 
-# Added parent argument to ensure QSoundEffect is correctly parented
+# --- Shared stylesheets, parsed once at application level ---
+# Widgets opt in via setObjectName instead of each carrying (and having Qt
+# re-parse) its own copy of these multi-line QSS literals.
+GLASS_BUTTON_QSS = """
+    QPushButton#glassButton {
+        /* Base Glass Effect */
+        color: #FFFFFF;
+        /* Semi-transparent background (10% opacity) */
+        background-color: rgba(255, 255, 255, 0.1);
+        /* Light, semi-transparent border (the 'glass' edge) */
+        border: 1px solid rgba(255, 255, 255, 0.4);
+        border-radius: 12px;
+        padding: 15px 30px;
+        outline: 0px;
+    }
+    QPushButton#glassButton:hover {
+        /* Hover: Slightly increase brightness and border visibility */
+        background-color: rgba(255, 255, 255, 0.2);
+        border: 1px solid rgba(255, 255, 255, 0.8);
+    }
+    QPushButton#glassButton:pressed {
+        /* Pressed: Darken to simulate being pressed into the surface */
+        background-color: rgba(0, 0, 0, 0.2);
+        border-style: inset;
+        border: 1px solid rgba(255, 255, 255, 0.3);
+    }
+"""
+
+BACK_BUTTON_QSS = """
+    QPushButton#glassBackButton {
+        color: #FFFFFF;
+        background-color: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.4);
+        border-radius: 8px; /* Slightly smaller radius for the back button */
+        padding: 10px 20px; /* Smaller padding than main buttons */
+        outline: 0px;
+    }
+    QPushButton#glassBackButton:hover {
+        background-color: rgba(255, 255, 255, 0.2);
+        border: 1px solid rgba(255, 255, 255, 0.8);
+    }
+    QPushButton#glassBackButton:pressed {
+        background-color: rgba(0, 0, 0, 0.2);
+        border-style: inset;
+        border: 1px solid rgba(255, 255, 255, 0.3);
+    }
+"""
+
+WIZARD_INPUT_QSS = """
+    QLineEdit#wizardInput {
+        background: rgba(0,0,0,0);
+        color: white;
+        border: none;
+        selection-background-color: rgba(255,255,255,50%);
+        padding: 5px;
+    }
+"""
+
+# Buttons in the task-selection dialog: the glass look with tighter
+# padding than the main menu buttons.
+DIALOG_BUTTON_QSS = """
+    QPushButton#dialogButton {
+        color: #FFFFFF;
+        background-color: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.4);
+        border-radius: 12px;
+        padding: 10px 20px;
+        outline: 0px;
+    }
+    QPushButton#dialogButton:hover {
+        background-color: rgba(255, 255, 255, 0.2);
+        border: 1px solid rgba(255, 255, 255, 0.8);
+    }
+    QPushButton#dialogButton:pressed {
+        background-color: rgba(0, 0, 0, 0.2);
+        border-style: inset;
+        border: 1px solid rgba(255, 255, 255, 0.3);
+    }
+"""
+
+# Active sort button in the task carousel; buttons toggle the data-active
+# property and the app stylesheet does the rest. The id is part of the
+# selector so this wins over the base glassButton rule.
+SORT_ACTIVE_QSS = """
+    QPushButton#glassButton[data-active="true"] {
+        background-color: rgba(0, 123, 255, 0.5); /* Blue highlight */
+        border: 1px solid rgba(0, 123, 255, 1.0);
+    }
+"""
+
+# Applied once via app.setStyleSheet at startup.
+APP_QSS = (GLASS_BUTTON_QSS + BACK_BUTTON_QSS + WIZARD_INPUT_QSS
+           + DIALOG_BUTTON_QSS + SORT_ACTIVE_QSS)
+
+
+# Fast date validation for the wizards' Return path: a precompiled regex
+# rejects malformed input cheaply, and date.fromisoformat (C-accelerated)
+# replaces strptime, which re-does locale/format setup on every call.
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+def parse_due_date(value):
+    """Parses a YYYY-MM-DD string, returning a date or None if invalid."""
+    if not _DATE_RE.match(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_tags(s):
+    """Splits a comma-separated tag string; empty input costs nothing.
+
+    The wizard engine already stripped the submission as a whole, so only
+    per-token whitespace remains — and each token is stripped exactly once.
+    """
+    if not s:
+        return []
+    return [t for t in (piece.strip() for piece in s.split(",")) if t]
+
+
+class _NotificationTask(QRunnable):
+    """Runs one send_notification call on a pool thread."""
+    def __init__(self, title, message):
+        super().__init__()
+        self.title = title
+        self.message = message
+
+    def run(self):
+        send_notification(self.title, self.message)
+
+
+def notify_async(title, message):
+    """Posts a desktop notification without blocking the GUI thread.
+
+    send_notification shells out to osascript, which can take tens of
+    milliseconds — long enough to delay the wizard's Return handling and
+    back-transition. Dispatching through the global QThreadPool lets the
+    UI continue immediately.
+    """
+    QThreadPool.globalInstance().start(_NotificationTask(title, message))
+
+
+# Cache of QFont objects keyed by point size. Font-engine resolution is not
+# free and the same few sizes are requested for every label/button/input.
+_font_cache = {}
+
+def get_font(size):
+    """Returns a cached QFont for the app font at the given point size."""
+    font = _font_cache.get(size)
+    if font is None or font.family() != FONT_NAME:
+        font = QFont(FONT_NAME, size)
+        _font_cache[size] = font
+    return font
+
+
+def track_animation(anims, anim):
+    """Tracks a running animation and drops the reference when it finishes.
+
+    Without the pruning the carousel windows accumulated every completed
+    animation for their whole lifetime, growing the list on each key press.
+    """
+    anims.append(anim)
+
+    def _done():
+        try:
+            anims.remove(anim)
+        except ValueError:
+            pass
+
+    anim.finished.connect(_done)
+    return anim
+
+
+def animate_font_size(label, start_size, end_size, parent, duration=250,
+                      start=True):
+    """Ramps a label's font size with a single QVariantAnimation.
+
+    Replaces the old per-step QTimer.singleShot cascade (10 timers and 10
+    lambdas per label per update) with one animation object driven by Qt's
+    shared timer. Pass start=False when the caller hands the animation to
+    a group that drives it instead.
+    """
+    anim = QVariantAnimation(parent)
+    anim.setStartValue(float(start_size))
+    anim.setEndValue(float(end_size))
+    anim.setDuration(duration)
+    anim.valueChanged.connect(lambda v, l=label: l.setFont(get_font(int(v))))
+    if start:
+        anim.start()
+    return anim
+
+
+# Cache of QSoundEffect objects keyed by filename. Decoding the same WAV for
+# every window that opens is wasted disk I/O; one shared instance per file is
+# enough, and parenting it to the QApplication keeps it alive for the session.
+_sound_cache = {}
+
 def load_sound(filename, parent=None):
+    """Returns the shared QSoundEffect for a bundled sound file.
+
+    The first call per filename loads the WAV; later calls are a dict hit.
+    The `parent` argument is ignored: shared sounds are parented to the
+    application instance so no window ever owns (or deletes) them.
+    """
+    sound = _sound_cache.get(filename)
+    if sound is not None:
+        return sound
+
+    from PyQt6.QtMultimedia import QSoundEffect
+
     path = pathlib.Path(__file__).parent/ "assets" / filename
     if not path.exists():
         print(f"Sound file not found: {path}")
         return None
 
-    # Pass the parent to QSoundEffect to prevent segmentation fault
-    sound = QSoundEffect(parent)
+    # Parent to the app (not a window) so closing a window can't destroy a
+    # sound another window is still using.
+    sound = QSoundEffect(QApplication.instance())
     sound.setSource(QUrl.fromLocalFile(str(path.resolve())))
     sound.setVolume(1)
+    _sound_cache[filename] = sound
     return sound
 
 
+# Every bundled sound, preloaded in one pass at startup.
+_ALL_SOUNDS = (
+    "move.wav", "select.wav", "menu_close.wav", "menu_back.wav",
+    "success.wav", "typing.wav", "error.wav",
+)
+
+def preload_assets():
+    """Warms the sound and font caches while the splash screen is up.
+
+    Opening the first wizard used to pay all the asset disk reads at once;
+    doing them here hides the cost behind the loading animation, so every
+    window afterwards constructs without touching the filesystem.
+    """
+    for name in _ALL_SOUNDS:
+        load_sound(name)
+    for size in (16, 18, 20, 24, 48):
+        get_font(size)
+
+
 # ----------------- Base Styled Window ----------------- #
 class StyledWindow(QWidget):
     """
     Base class for all windows, providing common styling, framelessness,
     always-on-top behavior, and animation/sound cleanup.
     """
+
+    # Minimum gap between typing-sound plays; below perception threshold but
+    # keeps fast typists from hammering the audio backend per keystroke.
+    TYPING_SOUND_GAP_MS = 40
+
     def __init__(self, title, width=800, height=600, top_padding=50):
         super().__init__()
         self.setWindowTitle(title)
@@ -94,12 +318,15 @@ class StyledWindow(QWidget):
         self.layout.setContentsMargins(20, top_padding, 20, 20)  # type: ignore # top padding here
         self.setLayout(self.layout) # type: ignore
 
-        # Initialize animation and sound holders
-        if not hasattr(self, '_anims'):
-            self._anims = []
+        # Initialize sound holder. (Animations need no equivalent list: they
+        # are parented QObjects, so Qt ownership already keeps and frees them.)
         if not hasattr(self, '_sounds'):
             self._sounds = []
 
+        # Widgets waiting for their drop shadow, applied on first show so
+        # window construction skips the effect allocations entirely.
+        self._pending_shadows = []
+
         # Load the dedicated 'menu_back.wav' for the Back to Menu button
         self.back_sound = load_sound("menu_back.wav", parent=self)
         self._sounds.append(self.back_sound) # Add to cleanup list
@@ -109,91 +336,105 @@ class StyledWindow(QWidget):
         self._sounds.append(self.success_sound)
         # ==============================================
 
+        # One reusable fade-out animation per window; _back_to_menu restarts
+        # it instead of allocating a new QPropertyAnimation per Back press.
+        self._fade_anim = QPropertyAnimation(self, b"windowOpacity", self)
+        self._fade_anim.setDuration(200)
+        self._fade_anim.setStartValue(1.0)
+        self._fade_anim.setEndValue(0.0)
+        self._fade_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._fade_anim.finished.connect(self._after_back_fade)
+
+        # Tracks the time since the last typing-sound play for throttling.
+        self._type_play_timer = QElapsedTimer()
+        self._type_play_timer.start()
 
-    def make_label(self, text, font_size=24):
-        """Creates a stylized QLabel with a drop shadow."""
+        # Set once the Back transition starts; repeated presses become
+        # no-ops instead of re-firing sounds into a closing window.
+        self._closing = False
+
+
+    def make_label(self, text, font_size=24, shadow=True):
+        """Creates a stylized QLabel, with a drop shadow unless disabled.
+
+        Pass shadow=False for chrome labels (headers, captions): each
+        shadowed widget is rendered offscreen and Gaussian-blurred on every
+        paint, which is wasted on small static text.
+        """
         lbl = QLabel(text)
-        lbl.setFont(QFont(FONT_NAME, font_size))
+        lbl.setFont(get_font(font_size))
         lbl.setStyleSheet("color: white;")
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(8)
-        shadow.setColor(QColor("black"))
-        shadow.setOffset(0)
-        lbl.setGraphicsEffect(shadow)
+        if shadow:
+            self._add_shadow(lbl, blur=8)
         return lbl
 
+    def _add_shadow(self, widget, blur=8):
+        """Queues a drop shadow for the widget, applied on first show.
+
+        Qt requires one QGraphicsDropShadowEffect instance per widget, so
+        the effects cannot be shared — but constructing them can at least be
+        deferred out of the window constructors.
+        """
+        self._pending_shadows.append((widget, blur))
+
+    def showEvent(self, event): # type: ignore
+        """Applies any queued drop shadows the first time the window shows."""
+        for widget, blur in self._pending_shadows:
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(blur)
+            shadow.setColor(QColor("black"))
+            shadow.setOffset(0)
+            widget.setGraphicsEffect(shadow)
+        self._pending_shadows = []
+        super().showEvent(event)
+
 
     def make_button(self, text, font_size=24):
             """Creates a stylized QPushButton with a glassmorphism look (used for sort buttons)."""
             btn = QPushButton(text)
-            btn.setFont(QFont(FONT_NAME, font_size))
-            
-            btn.setStyleSheet(
-                """
-                QPushButton {
-                    /* Base Glass Effect */
-                    color: #FFFFFF;
-                    /* Semi-transparent background (10% opacity) */
-                    background-color: rgba(255, 255, 255, 0.1); 
-                    /* Light, semi-transparent border (the 'glass' edge) */
-                    border: 1px solid rgba(255, 255, 255, 0.4);
-                    border-radius: 12px;
-                    padding: 15px 30px; 
-                    outline: 0px; 
-                }
-                
-                QPushButton:hover {
-                    /* Hover: Slightly increase brightness and border visibility */
-                    background-color: rgba(255, 255, 255, 0.2);
-                    border: 1px solid rgba(255, 255, 255, 0.8);
-                }
-                
-                QPushButton:pressed {
-                    /* Pressed: Darken to simulate being pressed into the surface */
-                    background-color: rgba(0, 0, 0, 0.2);
-                    border-style: inset;
-                    border: 1px solid rgba(255, 255, 255, 0.3);
-                }
-                """
-            )
+            btn.setFont(get_font(font_size))
+            # Styled by GLASS_BUTTON_QSS in the application stylesheet.
+            btn.setObjectName("glassButton")
             return btn
 
     def make_menu_button(self, text, font_size=24):
             """Creates a stylized QPushButton with a glassmorphism look, designed for the 'Back' function."""
             btn = QPushButton(text)
-            btn.setFont(QFont(FONT_NAME, font_size))
-                        
-            btn.setStyleSheet(
-                """
-                QPushButton {
-                    /* Base Glass Effect */
-                    color: #FFFFFF;
-                    /* Semi-transparent background (10% opacity) */
-                    background-color: rgba(255, 255, 255, 0.1); 
-                    /* Light, semi-transparent border (the 'glass' edge) */
-                    border: 1px solid rgba(255, 255, 255, 0.4);
-                    border-radius: 8px; /* Slightly smaller radius for the back button */
-                    padding: 10px 20px; /* Smaller padding than main buttons */
-                    outline: 0px; 
-                }
-                
-                QPushButton:hover {
-                    /* Hover: Slightly increase brightness and border visibility */
-                    background-color: rgba(255, 255, 255, 0.2);
-                    border: 1px solid rgba(255, 255, 255, 0.8);
-                }
-                
-                QPushButton:pressed {
-                    /* Pressed: Darken to simulate being pressed into the surface */
-                    background-color: rgba(0, 0, 0, 0.2);
-                    border-style: inset;
-                    border: 1px solid rgba(255, 255, 255, 0.3);
-                }
-                """
-            )
+            btn.setFont(get_font(font_size))
+            # Styled by BACK_BUTTON_QSS in the application stylesheet.
+            btn.setObjectName("glassBackButton")
             return btn
 
 
+    def _setup_input_field(self, input_field, return_callback=None):
+        """Applies the shared wizard input styling to a QLineEdit.
+
+        Single implementation of the setup that used to be copied into each
+        wizard: shared font, app-stylesheet object name, drop shadow, typing
+        sound (when the window has one) and Return handling.
+        """
+        input_field.setFont(get_font(24))
+        input_field.setObjectName("wizardInput")  # styled by WIZARD_INPUT_QSS
+        self._add_shadow(input_field, blur=12)
+
+        if getattr(self, "typing_sound", None):
+            # textEdited only fires for user keystrokes, so wizard-driven
+            # setText/clear calls no longer trigger the typing sound.
+            input_field.textEdited.connect(self._play_typing_sound)
+        if return_callback:
+            input_field.returnPressed.connect(return_callback)
+        return input_field
+
+    @pyqtSlot()
+    def _play_typing_sound(self):
+        """Plays the typing sound, rate-limited to one play per gap window."""
+        if self._closing:
+            return
+        sound = getattr(self, "typing_sound", None)
+        if sound and self._type_play_timer.elapsed() >= self.TYPING_SOUND_GAP_MS:
+            self._type_play_timer.restart()
+            sound.play()
+
     def make_back_button(self):
             """Creates a styled Back to Menu button at the bottom"""
             # Use the new glassmorphism style
@@ -204,71 +445,66 @@ class StyledWindow(QWidget):
             
             return btn
 
+    @pyqtSlot()
     def _back_to_menu(self):
         """Show parent menu and close current window. **Plays self.back_sound (menu_back.wav)**"""
+        # A transition is already in flight: pressing Back again would
+        # restart the fade and churn the audio thread with start/stop cycles.
+        if self._closing:
+            return
+        self._closing = True
+
         # This now uses the dedicated back sound (menu_back.wav)
         if self.back_sound:
             self.back_sound.play()
             
         if hasattr(self, "parent_menu") and self.parent_menu: # type: ignore
-            # Fade the current window out first for a smoother transition
-            fade = QPropertyAnimation(self, b"windowOpacity", self)
-            fade.setDuration(200)
-            fade.setStartValue(1.0)
-            fade.setEndValue(0.0)
-            fade.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-            def after_fade():
-                self.parent_menu.setWindowOpacity(1.0) # type: ignore # Ensure parent is fully opaque
-                self.parent_menu.show() # type: ignore
-                self.parent_menu.setFocus() # type: ignore # Ensure the carousel gets focus back
-                self.close()
-
-            fade.finished.connect(after_fade)
-            self._anims.append(fade)
-            fade.start()
-
+            # Fade the current window out first for a smoother transition,
+            # reusing the pooled animation (stop() resets a run in flight).
+            self._fade_anim.stop()
+            self._fade_anim.start()
         else:
             self.close()
 
+    @pyqtSlot()
+    def _after_back_fade(self):
+        """Finishes the Back transition once the pooled fade completes."""
+        self.parent_menu.setWindowOpacity(1.0) # type: ignore # Ensure parent is fully opaque
+        self.parent_menu.show() # type: ignore
+        self.parent_menu.setFocus() # type: ignore # Ensure the carousel gets focus back
+        self.close()
+
     def cleanup(self):
         """
-        Safely stop ongoing animations/sounds and schedule C++ objects for
-        deletion to prevent segmentation faults.
+        Safely stop ongoing sounds and the pooled fade animation. Animations
+        are parented QObjects, so Qt ownership destroys them with the window;
+        no bookkeeping list is needed.
         """
-        # Stop animations
+        self._fade_anim.stop()
+
+        # Subclasses that still track per-label animations clear them here.
         if hasattr(self, "_anims"):
             for anim in self._anims:
-                if isinstance(anim, (QPropertyAnimation, QVariantAnimation)):
-                    try:
-                        anim.stop()
-                        # Explicitly schedule for deletion to prevent segfault on shutdown
-                        anim.deleteLater()
-                    except Exception:
-                        pass
-            # Clear reference list
+                try:
+                    anim.stop()
+                except Exception:
+                    pass
             self._anims = []
 
-        # Stop sounds (references stored in self._sounds)
+        # Stop sounds. Every named sound attribute is registered in
+        # self._sounds at load time, so this one pass covers them all — no
+        # need for the old getattr sweep over hardcoded attribute names.
+        # The QSoundEffect objects themselves are shared app-wide via the
+        # load_sound cache, so they are only stopped here, never deleted.
         if hasattr(self, '_sounds'):
             for sound in self._sounds:
                 if sound:
                     try:
                         sound.stop()
-                        sound.deleteLater()
                     except Exception:
                         pass
             self._sounds = []
 
-        for sound_attr in ["move_sound", "select_sound", "typing_sound", "back_sound", "error_sound", "success_sound"]:
-            if hasattr(self, sound_attr) and getattr(self, sound_attr):
-                try:
-                    getattr(self, sound_attr).stop()
-                    getattr(self, sound_attr).deleteLater()
-                except Exception:
-                    pass
-                setattr(self, sound_attr, None)
-
     def closeEvent(self, event): # type: ignore
         """Override closeEvent to ensure cleanup runs on window close too."""
         self.cleanup()
@@ -286,80 +522,41 @@ class StyledWindow(QWidget):
 
 # ----------------- Base Wizard ----------------- #
 class BaseWizard(StyledWindow):
-    """Base class for multi-step input wizards."""
-    def __init__(self, title, parent_menu=None):
-        super().__init__(title)
-        self.parent_menu = parent_menu
-        if self.parent_menu:
-            self.parent_menu.hide()
-
-        self.layout.setSpacing(15) # type: ignore
-        self.layout.setContentsMargins(20, 20, 20, 20) # type: ignore
+    """Base class for multi-step input wizards.
 
-        # Back button always at bottom
-        self.back_button = self.make_back_button()
-
-        # Add a spacer to push content up
-        self.layout.insertStretch(0, 1) # type: ignore # push existing widgets to top
-
-        # NEW: Load the sound for error (for validation)
-        self.error_sound = load_sound("error.wav", parent=self)
-        self._sounds.append(self.error_sound)
-
-
-    def setup_input_field(self, return_callback=None):
-        """Reusable method for input field styling."""
-        input_field = QLineEdit()
-        input_field.setFont(QFont(FONT_NAME, 24))
-        input_field.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0,0,0,0);
-                color: white;
-                border: none;
-                selection-background-color: rgba(255,255,255,50%);
-                padding: 5px;
-            }
-        """)
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor("black"))
-        shadow.setOffset(0)
-        input_field.setGraphicsEffect(shadow)
-
-        if return_callback:
-            input_field.returnPressed.connect(return_callback)
+    Owns the whole step state machine (validate -> store -> clear ->
+    advance -> relabel) so subclasses only declare their steps and
+    override the validation/relabel/finish hooks.
+    """
 
-        self.layout.insertWidget(0, input_field)  # type: ignore # insert at top
-        return input_field
+    STEPS = ["Title", "Description", "Due Date", "Folder", "Tags"]
 
-# ----------------- Wizard Windows ----------------- #
-class AddTaskWizard(StyledWindow):
-    """Wizard for adding a new task."""
-    def __init__(self, manager, parent_menu=None):
-        super().__init__("Add Task", top_padding=10)
+    def __init__(self, title, manager, parent_menu=None, top_padding=50):
+        super().__init__(title, top_padding=top_padding)
         self.manager = manager
-        self.parent_menu = parent_menu  # reference to main menu
+        self.parent_menu = parent_menu
         if self.parent_menu:
-            self.parent_menu.hide()  # hide the menu
+            self.parent_menu.hide()
 
         # --- Load Typing Sound ---
         self.typing_sound = load_sound("typing.wav", parent=self)
         self._sounds.append(self.typing_sound)
         # -------------------------
-        
-        # NEW: Load the sound for error
+
+        # NEW: Load the sound for error (for validation)
         self.error_sound = load_sound("error.wav", parent=self)
         self._sounds.append(self.error_sound)
 
-        self.steps = ["Title", "Description", "Due Date", "Folder", "Tags"]
-        self.inputs = {}
+        self.steps = list(self.STEPS)
+        # One slot per step, indexed by current_step: the hot next_step path
+        # assigns by position instead of hashing the step's display name.
+        self.inputs = [None] * len(self.steps)
         self.current_step = 0
 
-        self.label = self.make_label(self.steps[self.current_step] + ":")
-
+        self.label = self.make_label("")
         self.input_field = QLineEdit()
-        self._setup_input_field()
-        
+        self._setup_input_field(self.input_field, self.next_step)
+
         self.layout.addWidget(self.label) # type: ignore
         self.layout.addWidget(self.input_field) # type: ignore
 
@@ -367,248 +564,181 @@ class AddTaskWizard(StyledWindow):
         self.layout.addItem(spacer) # type: ignore
 
         self.make_back_button()
+        self.update_step_label()
 
-    def _setup_input_field(self):
-        self.input_field.setFont(QFont(FONT_NAME, 24))
-        self.input_field.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0,0,0,0);
-                color: white;
-                border: none;
-                selection-background-color: rgba(255,255,255,50%);
-                padding: 5px;
-            }
-        """)
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor("black"))
-        shadow.setOffset(0)
-        self.input_field.setGraphicsEffect(shadow)
-        
-        # Connect typing sound
-        if self.typing_sound:
-            self.input_field.textChanged.connect(lambda: self.typing_sound.play()) # type: ignore
-            
-        self.input_field.returnPressed.connect(self.next_step)
-        
+    # --- Hooks for subclasses ---
+
+    def validate_step(self, step_name, value):
+        """Returns an error message for invalid input, or None to accept."""
+        return None
+
+    def transform_value(self, step_name, value):
+        """Maps the raw input to the value stored for this step."""
+        return value
+
+    def update_step_label(self):
+        """Refreshes the prompt label for the current step."""
+        self.label.setText(self.steps[self.current_step] + ":")
 
+    def on_finish(self):
+        """Called once every step has been collected."""
+        raise NotImplementedError
+
+    # --- Engine ---
+
+    @pyqtSlot()
     def next_step(self):
         value = self.input_field.text().strip()
         step_name = self.steps[self.current_step]
 
-        # 1. Validate title
-        if step_name == "Title" and not value:
-            send_notification("Error", "Title cannot be empty!")
-            if self.error_sound: self.error_sound.play() # Play error sound
+        error = self.validate_step(step_name, value)
+        if error:
+            notify_async("Error", error)
+            if self.error_sound: self.error_sound.play()
             return
 
-        # 2. Validate due date
-        if step_name == "Due Date":
-            # Allow empty string for optional due date
-            if value:
-                try:
-                    due_date = datetime.strptime(value, "%Y-%m-%d")
-                    today = datetime.now().date()
-                    if due_date.date() < today:
-                        send_notification("Error", "Due date cannot be before today!")
-                        if self.error_sound: self.error_sound.play() # Play error sound
-                        return
-                except ValueError:
-                    send_notification("Error", "Invalid date format! Use YYYY-MM-DD")
-                    if self.error_sound: self.error_sound.play() # Play error sound
-                    return
-        
         if self.success_sound:
             self.success_sound.play()
-        # ==============================================================================
 
-        self.inputs[step_name] = value
+        self.inputs[self.current_step] = self.transform_value(step_name, value)
         self.input_field.clear()
         self.current_step += 1
 
         if self.current_step >= len(self.steps):
-            self.finish_task()
+            self.on_finish()
         else:
-            self.label.setText(self.steps[self.current_step] + ":")
+            self.update_step_label()
+
+    def input_for(self, step_name):
+        """Returns the collected value for a named step (finish-time only)."""
+        return self.inputs[self.steps.index(step_name)]
+
+
+def _validate_due_date(value):
+    """Shared Due Date validation; returns an error message or None."""
+    if not value:
+        return None  # optional field
+    due = parse_due_date(value)
+    if due is None:
+        return "Invalid date format! Use YYYY-MM-DD"
+    if due < date.today():
+        return "Due date cannot be before today!"
+    return None
+
+# ----------------- Wizard Windows ----------------- #
+class AddTaskWizard(BaseWizard):
+    """Wizard for adding a new task."""
+    def __init__(self, manager, parent_menu=None):
+        super().__init__("Add Task", manager, parent_menu, top_padding=10)
+
+    def validate_step(self, step_name, value):
+        if step_name == "Title" and not value:
+            return "Title cannot be empty!"
+        if step_name == "Due Date":
+            return _validate_due_date(value)
+        return None
+
+    def on_finish(self):
+        self.finish_task()
 
     def finish_task(self):
         try:
             task = Task(
-                title=self.inputs.get("Title", ""),
-                description=self.inputs.get("Description", ""),
-                due_date=self.inputs.get("Due Date", ""),
-                tags=[t.strip() for t in self.inputs.get("Tags", "").split(",") if t.strip()],
-                folder=self.inputs.get("Folder", "")
+                title=self.input_for("Title"),
+                description=self.input_for("Description"),
+                due_date=self.input_for("Due Date"),
+                tags=_parse_tags(self.input_for("Tags")),
+                folder=self.input_for("Folder")
             )
             self.manager.add_task(task)
-            send_notification("Success", f"Task '{task.title}' added successfully!")
+            notify_async("Success", f"Task '{task.title}' added successfully!")
             
             if self.success_sound:
                 self.success_sound.play()
             # ==============================================
 
         except Exception as e:
-            send_notification("Error", f"Failed to add task: {str(e)}")
+            notify_async("Error", f"Failed to add task: {str(e)}")
             if self.error_sound: self.error_sound.play()
         finally:
             self._back_to_menu() # Use the standardized transition
 
 # ----------------- Edit Task Wizard  ----------------- #
-class EditTaskWizard(StyledWindow):
+class EditTaskWizard(BaseWizard):
     """
-    Wizard for editing an existing task's details. 
+    Wizard for editing an existing task's details.
     MODIFIED: Now uses the pre-selected task object and index instead of prompting for ID.
     """
-    def __init__(self, manager, task_index, task, parent_menu=None):
-        super().__init__(f"Edit Task #{task_index + 1}", top_padding=50)
-        self.manager = manager
-        self.parent_menu = parent_menu
-        if self.parent_menu:
-            self.parent_menu.hide()
-
-        # --- Load Typing Sound ---
-        self.typing_sound = load_sound("typing.wav", parent=self)
-        self._sounds.append(self.typing_sound)
-        # -------------------------
-
-        self.error_sound = load_sound("error.wav", parent=self)
-        self._sounds.append(self.error_sound)
+    # Task attribute for each step, parallel to STEPS: spares next_step the
+    # per-keystroke lower().replace() string churn.
+    _STEP_ATTRS = ("title", "description", "due_date", "folder", "tags")
 
+    def __init__(self, manager, task_index, task, parent_menu=None):
+        # The step hooks read the task, so stash it before the base
+        # constructor runs the first update_step_label.
         self.current_task = task
-        self.current_task_original_title = task.title # Store original title for manager lookup
+        self.current_task_original_title = task.title # Store original title for display
         self.current_task_index = task_index
-        # ========================================================
-
-        # Start directly at the first edit step
-        self.steps = ["Title", "Description", "Due Date", "Folder", "Tags"]
-        self.inputs = {}
-        self.current_step = 0
-
-        # Setup input field for the FIRST attribute (Title)
-        self.input_field = QLineEdit()
-        self._setup_input()
-
-        # Initialize and display the first step
-        self.label = self.make_label("") # Will be set in _set_next_step_label
-
-        self.layout.addWidget(self.label) # type: ignore
-        self.layout.addWidget(self.input_field) # type: ignore
-        
-        # Set the initial label/placeholder for 'Title'
-        self._set_next_step_label() 
-
-        spacer = QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-        self.layout.addItem(spacer) # type: ignore
-
-        self.make_back_button()
-
-    def _setup_input(self):
-        """Setup common input field styling."""
-        self.input_field.setFont(QFont(FONT_NAME, 24))
-        self.input_field.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0,0,0,0);
-                color: white;
-                border: none;
-                selection-background-color: rgba(255,255,255,50%);
-                padding: 5px;
-            }
-        """)
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor("black"))
-        shadow.setOffset(0)
-        self.input_field.setGraphicsEffect(shadow)
-        
-        # Connect typing sound
-        if self.typing_sound:
-            self.input_field.textChanged.connect(lambda: self.typing_sound.play()) # type: ignore
-            
-        self.input_field.returnPressed.connect(self.next_step)
-        
-    def _set_next_step_label(self):
-        """Helper to set the label and placeholder based on the current step."""
-        if self.current_step < len(self.steps):
-            next_step_name = self.steps[self.current_step]
-            next_attr_name = next_step_name.lower().replace(' ', '_')
-            
-            # Get current value for display/placeholder
-            current_display_value = getattr(self.current_task, next_attr_name)
-            if next_attr_name == 'tags':
-                current_display_value = ", ".join(current_display_value)
-
-            # Set the label to show current value and prompt for new input
-            self.label.setText(f"Editing '{self.current_task_original_title}' — {next_step_name} [Current: {current_display_value}]:")
-            self.input_field.setPlaceholderText(str(current_display_value))
-            self.input_field.clear() # Ensure input is clear for new value
-        
-
-    def next_step(self):
-        value = self.input_field.text().strip()
-        
+        # Constant part of the step prompt, rendered once instead of being
+        # re-formatted on every step advance.
+        self._label_prefix = f"Editing '{task.title}' — "
+        super().__init__(f"Edit Task #{task_index + 1}", manager, parent_menu)
+
+    def _current_display_value(self, step_index):
+        """Returns the task's current value for a step, formatted for display."""
+        attr_name = self._STEP_ATTRS[step_index]
+        value = getattr(self.current_task, attr_name)
+        if attr_name == 'tags':
+            value = ", ".join(value)
+        return value
+
+    def update_step_label(self):
+        """Shows the current value and prompts for the new one."""
         step_name = self.steps[self.current_step]
-        attr_name = step_name.lower().replace(' ', '_')
-        
-        # 1.: Check Due Date if provided
-        if step_name == "Due Date" and value:
-            try:
-                due_date = datetime.strptime(value, "%Y-%m-%d")
-                today = datetime.now().date()
-                if due_date.date() < today:
-                    send_notification("Error", "Due date cannot be before today!")
-                    if self.error_sound: self.error_sound.play() 
-                    return
-            except ValueError:
-                send_notification("Error", "Invalid date format! Use YYYY-MM-DD")
-                if self.error_sound: self.error_sound.play() 
-                return
-        
-        # 2. Store input (or preserved original value if empty)
-        if not value:
-            # If input is empty, preserve the current task value
-            preserved_value = getattr(self.current_task, attr_name)
-            if attr_name == 'tags':
-                preserved_value = ", ".join(preserved_value)
-            self.inputs[step_name] = preserved_value
-        else:
-            # Use the user's new input
-            self.inputs[step_name] = value
+        current_display_value = self._current_display_value(self.current_step)
+        self.label.setText(f"{self._label_prefix}{step_name} [Current: {current_display_value}]:")
+        self.input_field.setPlaceholderText(str(current_display_value))
+        self.input_field.clear() # Ensure input is clear for new value
 
-        if self.success_sound:
-            self.success_sound.play()
-        # ==============================================================================
-
-        self.current_step += 1
+    def validate_step(self, step_name, value):
+        if step_name == "Due Date":
+            return _validate_due_date(value)
+        return None
 
-        if self.current_step >= len(self.steps):
-            self.finish_edit()
-        else:
-            self._set_next_step_label() # Proceed to the next editing step
-        # ========================================================
+    def transform_value(self, step_name, value):
+        # Empty input preserves the task's current value
+        if not value:
+            return self._current_display_value(self.current_step)
+        return value
 
+    def on_finish(self):
+        self.finish_edit()
 
     def finish_edit(self):
         updates = {
             # Use the input value, defaulting to the original if input was empty at the Title step
-            "title": self.inputs.get("Title", self.current_task.title), 
-            "description": self.inputs.get("Description", self.current_task.description),
-            "due_date": self.inputs.get("Due Date", self.current_task.due_date),
-            "folder": self.inputs.get("Folder", self.current_task.folder),
+            # Every slot is filled by the time on_finish runs; empty input
+            # was already mapped to the preserved value in transform_value.
+            "title": self.input_for("Title"),
+            "description": self.input_for("Description"),
+            "due_date": self.input_for("Due Date"),
+            "folder": self.input_for("Folder"),
             # Tags are always handled as a comma-separated string that needs splitting
-            "tags": [t.strip() for t in self.inputs.get("Tags", "").split(",") if t.strip()] 
+            "tags": _parse_tags(self.input_for("Tags"))
         }
 
         try:
-            # Use the original title to find the task in the manager before applying updates
-            self.manager.edit_task(self.current_task_original_title, updates)
-            send_notification("Success", f"Task '{updates['title']}' updated!")
+            # The wizard already holds the task's index, so edit by position
+            # instead of re-resolving the original title.
+            self.manager.edit_task_by_index(self.current_task_index, updates)
+            notify_async("Success", f"Task '{updates['title']}' updated!")
             
             if self.success_sound:
                 self.success_sound.play()
             # ==============================================
 
         except Exception as e:
-            send_notification("Error", f"Failed to edit task: {str(e)}")
+            notify_async("Error", f"Failed to edit task: {str(e)}")
             if self.error_sound: self.error_sound.play() # NEW: Play error sound
         finally:
             self._back_to_menu() # Use the standardized transition
@@ -633,7 +763,7 @@ class DeleteTaskWizard(StyledWindow):
 
         self.label = self.make_label("Enter Task ID to Delete:")
         self.input_field = QLineEdit()
-        self._setup_input()
+        self._setup_input_field(self.input_field, self.delete_task)
         self.layout.addWidget(self.label) # type: ignore
         self.layout.addWidget(self.input_field) # type: ignore
 
@@ -642,54 +772,36 @@ class DeleteTaskWizard(StyledWindow):
 
         self.make_back_button()
 
-    def _setup_input(self):
-        """Setup common input field styling and connect to delete_task."""
-        self.input_field.setFont(QFont(FONT_NAME, 24))
-        self.input_field.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0,0,0,0);
-                color: white;
-                border: none;
-                selection-background-color: rgba(255,255,255,50%);
-                padding: 5px;
-            }
-        """)
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor("black"))
-        shadow.setOffset(0)
-        self.input_field.setGraphicsEffect(shadow)
-        
-        # Connect typing sound
-        if self.typing_sound:
-            self.input_field.textChanged.connect(lambda: self.typing_sound.play()) # type: ignore
-            
-        self.input_field.returnPressed.connect(self.delete_task)
-
+    @pyqtSlot()
     def delete_task(self):
         id_str = self.input_field.text().strip()
-        
+
+        # Branch instead of try/except ValueError: raising and unwinding an
+        # exception for a typo costs orders of magnitude more than isdigit.
+        if not id_str.isdigit():
+            notify_async("Error", "Please enter a valid number for the Task ID.")
+            if self.error_sound: self.error_sound.play() # NEW: Play error sound
+            self._back_to_menu()
+            return
+
         try:
             task_index = int(id_str) - 1 # Convert user's 1-based ID to 0-based index
             if not 0 <= task_index < len(self.manager.tasks):
-                send_notification("Error", f"Task ID {id_str} is out of range.")
+                notify_async("Error", f"Task ID {id_str} is out of range.")
                 if self.error_sound: self.error_sound.play() # NEW: Play error sound
                 return
-            
+
             task = self.manager.tasks[task_index]
-            
-            self.manager.delete_task(task.title) # Delete by original title
-            send_notification("Success", f"Task '{task.title}' (ID: {id_str}) deleted!")
-            
+
+            self.manager.delete_task_by_index(task_index) # Delete by position
+            notify_async("Success", f"Task '{task.title}' (ID: {id_str}) deleted!")
+
             if self.success_sound:
                 self.success_sound.play()
             # ==============================================
-            
-        except ValueError:
-            send_notification("Error", "Please enter a valid number for the Task ID.")
-            if self.error_sound: self.error_sound.play() # NEW: Play error sound
+
         except Exception as e:
-            send_notification("Error", f"Failed to delete task: {str(e)}")
+            notify_async("Error", f"Failed to delete task: {str(e)}")
             if self.error_sound: self.error_sound.play() # NEW: Play error sound
 
         self._back_to_menu() # Use the standardized transition
@@ -724,7 +836,7 @@ class UpdateStatusWizard(StyledWindow):
         # ======================================================
         
         self.input_field = QLineEdit()
-        self._setup_input()
+        self._setup_input_field(self.input_field, self.update_status)
         self.layout.addWidget(self.label) # type: ignore
         self.layout.addWidget(self.input_field) # type: ignore
 
@@ -733,55 +845,68 @@ class UpdateStatusWizard(StyledWindow):
 
         self.make_back_button()
 
-    def _setup_input(self):
-        """Setup common input field styling and connect to next_step."""
-        self.input_field.setFont(QFont(FONT_NAME, 24))
-        self.input_field.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0,0,0,0);
-                color: white;
-                border: none;
-                selection-background-color: rgba(255,255,255,50%);
-                padding: 5px;
-            }
-        """)
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor("black"))
-        shadow.setOffset(0)
-        self.input_field.setGraphicsEffect(shadow)
-        
-        # Connect typing sound
-        if self.typing_sound:
-            self.input_field.textChanged.connect(lambda: self.typing_sound.play()) # type: ignore
-            
-        self.input_field.returnPressed.connect(self.update_status)
-        # ============================================================
-
+    @pyqtSlot()
     def update_status(self):
         value = self.input_field.text().strip()
 
         if value not in self.statuses:
-            send_notification("Error", f"Invalid status: {value}. Use one of: {', '.join(self.statuses)}")
+            notify_async("Error", f"Invalid status: {value}. Use one of: {', '.join(self.statuses)}")
             if self.error_sound: self.error_sound.play()
             return
 
         try:
-            # Use the pre-selected task's title for the update
-            self.manager.edit_task(self.current_task.title, {"status": value})
-            send_notification("Success", f"Status updated for '{self.current_task.title}' to '{value}'!")
+            # The wizard already holds the task's index, so edit by position
+            self.manager.edit_task_by_index(self.current_task_index, {"status": value})
+            notify_async("Success", f"Status updated for '{self.current_task.title}' to '{value}'!")
 
             if self.success_sound:
                 self.success_sound.play()
             # ==============================================
 
         except Exception as e:
-            send_notification("Error", f"Failed to update status: {str(e)}")
+            notify_async("Error", f"Failed to update status: {str(e)}")
             if self.error_sound: self.error_sound.play()
 
         self._back_to_menu() # Use the standardized transition
     # ======================================================
 
+# ----------------- Task List Model ----------------- #
+class TaskListModel(QAbstractListModel):
+    """
+    List model exposing one pre-formatted row per task.
+
+    Views over this model only instantiate delegates for visible rows, so
+    showing N tasks no longer means N QLabel widgets plus N effects.
+    """
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self._rows = rows if rows is not None else []
+
+    def rowCount(self, parent=QModelIndex()): # type: ignore
+        return len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole): # type: ignore
+        # Views probe half a dozen roles per visible row on every paint;
+        # bail out on the role check alone before touching the index.
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if not index.isValid():
+            return None
+        return self._rows[index.row()]
+
+    def set_rows(self, rows):
+        """Replaces the rows in one model reset (one view relayout)."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
+def format_task_row(task):
+    """Formats one task into the plain list-row string."""
+    return (f"{task.title} | {task.status} | {task.due_date} | "
+            f"{task.folder or '-'} | {', '.join(task.tags)}")
+
+
 # ----------------- View Tasks ----------------- #
 class ViewTasksWindow(StyledWindow):
     """Simple list view of all tasks (deprecated/unused by final GUI)."""
@@ -789,31 +914,31 @@ class ViewTasksWindow(StyledWindow):
         super().__init__("View Tasks", width=1000, height=700)
         self.manager = manager
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        container = QFrame()
-        container_layout = QVBoxLayout()
-        container.setLayout(container_layout)
-
-        if not manager.tasks:
-            container_layout.addWidget(self.make_label("No tasks found", 20))
-        else:
-            for t in manager.tasks:
-                lbl = self.make_label(
-                    f"{t.title} | {t.status} | {t.due_date} | {t.folder or '-'} | {', '.join(t.tags)}",
-                    20
-                )
-                container_layout.addWidget(lbl)
-
-        scroll.setWidget(container)
-        self.layout.addWidget(scroll) # type: ignore
+        rows = [format_task_row(t) for t in manager.tasks] or ["No tasks found"]
+        self.model = TaskListModel(rows, self)
+
+        view = QListView()
+        view.setModel(self.model)
+        view.setFont(get_font(20))
+        view.setStyleSheet("color: white; background: transparent; border: none;")
+        view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        # Every row renders the same single-line string, so the view can
+        # size one item and lay the rest out in batches instead of
+        # measuring all N rows up front.
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.layout.addWidget(view) # type: ignore
 
 # ----------------- Main Menu Window Wrapper ----------------- #
 class MainMenuWindow(StyledWindow):
     """
-    A wrapper for the CarouselMenu to apply StyledWindow properties 
+    A wrapper for the CarouselMenu to apply StyledWindow properties
     and add static header elements (time, author).
     """
+    # Default so the event handlers below can test with a plain attribute
+    # read; hasattr is slower and these run on every key/show event.
+    carousel_menu = None
+
     def __init__(self, manager, options, callbacks):
         # Use a smaller height/width as the CarouselMenu handles its own sizing
         super().__init__("Cyberpunk Task Manager", width=600, height=400, top_padding=10) 
@@ -863,15 +988,17 @@ class MainMenuWindow(StyledWindow):
         
         # --- Left Label: Time Now (Neon Green, slightly larger) ---
         # Note: make_label applies FONT_NAME and shadow by default
-        self.time_label = self.make_label("Time: 00:00:00", font_size=20) 
-        self.time_label.setStyleSheet(self.time_label.styleSheet() + "color: #00FF00;") # Neon Green
+        # No shadow: this label repaints every second, so the per-paint blur
+        # would be pure ongoing cost.
+        self.time_label = self.make_label("Time: 00:00:00", font_size=20, shadow=False)
+        self.time_label.setStyleSheet("color: #00FF00;") # Neon Green
         header_layout.addWidget(self.time_label)
         
         # Spacer to push elements apart
         header_layout.addItem(QSpacerItem(20, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)) 
         
         # --- Right Label: Author (Subtle Blue background, smaller font) ---
-        self.author_label = self.make_label("Author: Jyun", font_size=16) # Smaller size
+        self.author_label = self.make_label("Author: Jyun", font_size=16, shadow=False) # Smaller size
         self.author_label.setStyleSheet("""
             QLabel {
                 color: #66FFFF; /* Light Blue */
@@ -884,36 +1011,52 @@ class MainMenuWindow(StyledWindow):
         
         self.layout.addWidget(header_widget) # type: ignore
         
-        # Setup timer to update the time every second
+        # Clock timer; showEvent starts it and hideEvent stops it, so the
+        # 1 Hz wakeups only happen while the menu is actually on screen.
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._update_time)
-        self.timer.start(1000) # Update every 1000ms (1 second)
 
+    @pyqtSlot()
     def _update_time(self):
         """Updates the time label with the current system time."""
         current_time = datetime.now().strftime("%H:%M:%S")
         self.time_label.setText(f"Time: {current_time}")
-        
+
+    @pyqtSlot()
+    def _start_clock(self):
+        """Starts the 1 Hz clock ticks, aligned to the wall-clock second."""
+        if not self.isVisible():
+            return
+        self._update_time()
+        self.timer.start(1000)
+
+    def hideEvent(self, event): # type: ignore
+        """Stops the clock while the menu is hidden behind another window."""
+        self.timer.stop()
+        super().hideEvent(event)
+
     def showEvent(self, event): # type: ignore
         """Ensures the time is current and the carousel is reset when the window is shown."""
         self._update_time()
-        # The parent menu itself needs to be shown, and the carousel needs its state reset
-        if hasattr(self, 'carousel_menu'):
-            # --- SAFEGUARD: Force the carousel to refresh its labels ---
-            self.carousel_menu.update_labels(initial=True) 
-            # ----------------------------------------------------------
+        # Fire the first tick on the next second boundary so the label
+        # updates in step with the displayed time rather than mid-second.
+        QTimer.singleShot(1000 - datetime.now().microsecond // 1000, self._start_clock)
+        # The carousel's own showEvent resets its labels; calling
+        # update_labels here as well ran the 5-label animation setup twice
+        # per menu re-entry.
+        if self.carousel_menu is not None:
             self.carousel_menu.showEvent(event)
         super().showEvent(event)
         
     def setFocus(self): # type: ignore
         """Forward focus to the carousel so key events work."""
-        if hasattr(self, 'carousel_menu'):
+        if self.carousel_menu is not None:
             self.carousel_menu.setFocus()
             
     def keyPressEvent(self, event): # type: ignore
         """Forward key events to the contained CarouselMenu."""
         # MainMenuWindow should only forward to CarouselMenu, as it has no other input fields
-        if hasattr(self, 'carousel_menu'):
+        if self.carousel_menu is not None:
             self.carousel_menu.keyPressEvent(event)
         else:
             super().keyPressEvent(event)
@@ -921,6 +1064,30 @@ class MainMenuWindow(StyledWindow):
 
 
 # ----------------- Carousel Menu ----------------- #
+class ShadowLabel(QLabel):
+    """QLabel that paints a cheap two-pass text shadow.
+
+    QGraphicsDropShadowEffect routes every repaint through an offscreen
+    buffer plus a blur pass, and the carousels animate dozens of repaints
+    per navigation. Drawing the text twice — once offset in black, once in
+    white on top — keeps the look for the price of two drawText calls.
+    """
+
+    SHADOW_OFFSET = 2
+
+    def paintEvent(self, event): # type: ignore
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        flags = int(self.alignment())
+        painter.setPen(QColor("black"))
+        painter.drawText(
+            self.rect().translated(self.SHADOW_OFFSET, self.SHADOW_OFFSET),
+            flags, self.text()
+        )
+        painter.setPen(QColor("white"))
+        painter.drawText(self.rect(), flags, self.text())
+
+
 class CarouselMenu(QWidget):
     """
     Main menu widget with a vertical, animated carousel selection.
@@ -935,6 +1102,7 @@ class CarouselMenu(QWidget):
         self.spacing = spacing
         self.current_index = 0
         self.labels = []
+        self._visible = set()  # indices of labels currently shown
         self._anims = []
         self._sounds = []
 
@@ -946,14 +1114,25 @@ class CarouselMenu(QWidget):
         
         self._sounds.extend([self.move_sound, self.select_sound, self.exit_sound])
 
+        # Coalesce held-key navigation: OS key repeat can fire ~30 events/s,
+        # each of which would start a fresh batch of animations. Queued
+        # deltas are applied at most once per timer tick instead.
+        self._nav_delta = 0
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(30)
+        self._nav_timer.timeout.connect(self._apply_nav_delta)
+
+        # Reused group for the per-navigation label animations.
+        self._nav_group = QParallelAnimationGroup(self)
+
         # IMPORTANT: Setting a size policy here ensures it expands within its parent (MainMenuWindow)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
 
         self._init_labels()
-        # Initial labels update should be done after the widget is fully placed 
-        # in the parent's layout, but we call it here and again in showEvent.
-        self.update_labels(initial=True) 
+        # No update_labels here: the widget has no valid size until it is
+        # placed in the parent's layout, so showEvent does the first layout.
 
     def _init_labels(self):
         # We assume the parent (MainMenuWindow) sets the stage width/height
@@ -961,20 +1140,15 @@ class CarouselMenu(QWidget):
         window_width = 600 
         
         for option in self.options:
-            lbl = QLabel(option, self)
+            # ShadowLabel paints its own shadow; a blur effect per label
+            # would force every animated repaint through an offscreen pass.
+            lbl = ShadowLabel(option, self)
             lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            font = QFont(FONT_NAME, self.font_size)
+            font = get_font(self.font_size)
             lbl.setFont(font)
             # Set size based on the assumed window width, not self.width() which might be 0 initially
-            lbl.resize(window_width, self.font_size + 20) 
+            lbl.resize(window_width, self.font_size + 20)
 
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(8)
-            shadow.setColor(QColor("black"))
-            shadow.setOffset(0)
-            lbl.setGraphicsEffect(shadow)
-
-            lbl.setStyleSheet("color: white;")
             lbl.show()
             self.labels.append(lbl)
 
@@ -983,52 +1157,80 @@ class CarouselMenu(QWidget):
         if self.height() == 0:
             return
             
-        center_y = self.height() // 2 
-        
-        for i, lbl in enumerate(self.labels):
+        center_y = self.height() // 2
+
+        # Only the five labels around the cursor are ever shown (two above,
+        # two below), so work out that window up front and touch nothing
+        # outside it: navigation costs O(1) instead of a pass over every
+        # label. A full pass only happens when the state is unknown (initial).
+        visible = {
+            self.current_index + d for d in (-2, -1, 0, 1, 2)
+            if 0 <= self.current_index + d < len(self.labels)
+        }
+        if initial:
+            for i, lbl in enumerate(self.labels):
+                lbl.setVisible(i in visible)
+        else:
+            for i in self._visible - visible:
+                self.labels[i].hide()
+            for i in visible - self._visible:
+                self.labels[i].show()
+        self._visible = visible
+
+        # One reused group drives every visible label off a single timer.
+        # Clearing it also deletes the previous navigation's animations, so
+        # a new key press replaces the old motion instead of stacking on it.
+        group = self._nav_group
+        group.stop()
+        group.clear()
+
+        for i in visible:
+            lbl = self.labels[i]
             distance = i - self.current_index
-            
-            # Show more labels when the menu is tall, but keep it centered
-            if abs(distance) > 2: # Show two items above and below the center (5 total visible)
-                lbl.hide()
-                continue
-            else:
-                lbl.show()
 
             target_y = center_y + distance * (self.font_size + self.spacing)
             target_size = self.font_size * (1.3 if distance == 0 else 1.0)
 
             # Animate position
-            anim_pos = QPropertyAnimation(lbl, b"pos", self)
+            anim_pos = QPropertyAnimation(lbl, b"pos")
             anim_pos.setDuration(250)
             # Center X: (self.width() - label.width) / 2
             # Use self.width() now that it's reliably sized by the parent
-            center_x = (self.width() - lbl.width()) // 2 
+            center_x = (self.width() - lbl.width()) // 2
             anim_pos.setEndValue(QPoint(center_x, target_y - int(target_size)//2))
             anim_pos.setEasingCurve(QEasingCurve.Type.OutCubic)
-            self._anims.append(anim_pos)
-            anim_pos.start()
-
-            # Animate font size smoothly (using QTimer for simpler size transition)
-            start_size = lbl.font().pointSize()
-            steps = 10
-            delta = (target_size - start_size)/steps
-            for step in range(1, steps+1):
-                QTimer.singleShot(step*25, lambda s=start_size+delta*step, l=lbl: l.setFont(QFont(FONT_NAME, int(s))))
+            group.addAnimation(anim_pos)
+
+            # Animate font size smoothly with one animation per label
+            group.addAnimation(animate_font_size(
+                lbl, lbl.font().pointSize(), int(target_size), self, start=False
+            ))
+
+        group.start()
+
+    def _queue_nav(self, delta):
+        """Queues a navigation step, applied on the next throttle tick."""
+        self._nav_delta += delta
+        if not self._nav_timer.isActive():
+            self._nav_timer.start()
+
+    @pyqtSlot()
+    def _apply_nav_delta(self):
+        """Applies the accumulated Up/Down delta as one move."""
+        delta, self._nav_delta = self._nav_delta, 0
+        new_index = max(0, min(len(self.options) - 1, self.current_index + delta))
+        if new_index == self.current_index:
+            return
+        self.current_index = new_index
+        self.update_labels()
+        if self.move_sound:
+            self.move_sound.play()
 
     def keyPressEvent(self, event): # type: ignore
         if event.key() == Qt.Key.Key_Up:
-            if self.current_index > 0:
-                self.current_index -= 1
-                self.update_labels()
-                if self.move_sound:
-                    self.move_sound.play()
+            self._queue_nav(-1)
         elif event.key() == Qt.Key.Key_Down:
-            if self.current_index < len(self.options) - 1:
-                self.current_index += 1
-                self.update_labels()
-                if self.move_sound:
-                    self.move_sound.play()
+            self._queue_nav(1)
         elif event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
             
             is_exit = (self.current_index == len(self.options) - 1)
@@ -1071,21 +1273,14 @@ class CarouselMenu(QWidget):
             label.setFont(f)
         size_anim.valueChanged.connect(on_size_changed)
 
-        opacity_effect = QGraphicsOpacityEffect(label)
-        label.setGraphicsEffect(opacity_effect)
-        op_anim = QVariantAnimation(self)
-        op_anim.setStartValue(1.0)
-        op_anim.setEndValue(0.0)
-        op_anim.setDuration(250)
-        op_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        op_anim.valueChanged.connect(lambda v: opacity_effect.setOpacity(float(v)))
-
-        def after_label_anim():
+        # The windowOpacity fade below already covers the visual fade-out;
+        # a per-label QGraphicsOpacityEffect would only add an offscreen
+        # composition of the label on top of it.
+        def after_pulse():
             f = label.font()
             f.setPointSize(start_size)
             label.setFont(f)
-            label.setGraphicsEffect(None)
-            
+
             # Fade the whole window out (window is now MainMenuWindow, the parent)
             parent_window = self.parentWidget()
             if parent_window:
@@ -1098,18 +1293,15 @@ class CarouselMenu(QWidget):
                 def after_fade():
                     self.option_selected.emit(self.current_index)
 
-
                 fade.finished.connect(after_fade)
-                self._anims.append(fade)
+                track_animation(self._anims, fade)
                 fade.start()
             else:
                 self.option_selected.emit(self.current_index)
 
+        size_anim.finished.connect(after_pulse)
 
-        size_anim.finished.connect(lambda: op_anim.start())
-        op_anim.finished.connect(after_label_anim)
-
-        self._anims.extend([size_anim, op_anim])
+        track_animation(self._anims, size_anim)
         size_anim.start()
         
     def showEvent(self, event): # type: ignore
@@ -1117,33 +1309,30 @@ class CarouselMenu(QWidget):
         Overrides showEvent to ensure the menu state is correctly reset
         when returning from a child window, preventing visual glitches.
         """
-        # 1. Ensure window opacity is fully reset (now handles by parent MainMenuWindow)
-        # self.setWindowOpacity(1.0) 
-        
-        # 2. Re-show all labels (they might have been hidden/faded out)
-        for lbl in self.labels:
-            lbl.show()
-            
-        # 3. Re-run update_labels to reset positions and font sizes correctly
+        # update_labels(initial=True) does a full visibility pass, so it
+        # both re-shows the labels around the cursor and hides the rest —
+        # no separate show-everything loop needed first.
         self.update_labels(initial=True)
-        
+
         super().showEvent(event) # Call the base implementation
 
     def cleanup(self):
         """Safely stop animations and sounds for the main Carousel Menu."""
+        self._nav_group.stop()
+        # Animations are parented to this widget; stopping and dropping the
+        # references lets Qt ownership handle destruction.
         for anim in self._anims:
             try:
                 anim.stop()
-                anim.deleteLater()
             except Exception:
                 pass
         self._anims = []
 
+        # Shared sounds (load_sound cache) are stopped, never deleted.
         for sound in self._sounds:
             if sound:
                 try:
                     sound.stop()
-                    sound.deleteLater()
                 except Exception:
                     pass
         self._sounds = []
@@ -1171,7 +1360,10 @@ class TaskCarouselWindow(StyledWindow):
         self.spacing = 20
         self.current_index = 0
         self.labels = []
+        self._visible = set()  # indices of labels currently shown
+        self._anims = [] # Per-label animations still tracked by this window
         self.tasks = [] # Store the *sorted* list of tasks
+        self._display_cache = {} # id(task) -> (status prefix, truncated title)
         self.detail_label = None
         self.sort_key = 'ID' # Default sort key
         self.sort_buttons = {}
@@ -1180,12 +1372,24 @@ class TaskCarouselWindow(StyledWindow):
         self.select_sound = load_sound("select.wav", parent=self)
         self._sounds.extend([self.move_sound, self.select_sound])
 
+        # Same held-key throttle as CarouselMenu: queue deltas and apply
+        # them at most once per tick instead of once per key-repeat event.
+        self._nav_delta = 0
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(30)
+        self._nav_timer.timeout.connect(self._apply_nav_delta)
+
+        # Reused group for the per-navigation label animations.
+        self._nav_group = QParallelAnimationGroup(self)
+
         # --- Sort Controls (Inserted at the top of the layout) ---
         self._create_sort_controls()
-        
-        # Spacer to push carousel down
-        self.spacer = QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-        self.layout.addItem(self.spacer) # type: ignore
+
+        # The labels below are positioned absolutely and never touch the
+        # layout; a plain stretch pins the sort row to the top without a
+        # named spacer item to keep around.
+        self.layout.addStretch(1) # type: ignore
 
         self.load_tasks()
         # The back button is created here. make_back_button now uses the glassmorphism style.
@@ -1199,38 +1403,44 @@ class TaskCarouselWindow(StyledWindow):
         sort_layout.setContentsMargins(0, 0, 0, 0)
         sort_layout.setSpacing(10)
 
-        sort_layout.addWidget(self.make_label("Sort By:", 18))
+        sort_layout.addWidget(self.make_label("Sort By:", 18, shadow=False))
 
         for key in self.SORT_KEYS:
             # Use make_button here for the sort buttons as it was already defined for them
-            btn = self.make_button(key, 18) 
-            
-            # Additional style for active button (which make_button doesn't handle)
-            btn.setStyleSheet(btn.styleSheet() + """
-                QPushButton[data-active="true"] {
-                    background-color: rgba(0, 123, 255, 0.5); /* Blue highlight */
-                    border: 1px solid rgba(0, 123, 255, 1.0);
-                }
-            """)
-            
+            btn = self.make_button(key, 18)
+
+            # Base glass look and the active highlight both come from the
+            # app stylesheet (SORT_ACTIVE_QSS); the button only toggles the
+            # data-active property, so no per-button QSS parse happens here.
             btn.setProperty("data-active", 'true' if key == self.sort_key else 'false')
-            btn.clicked.connect(functools.partial(self._set_sort_key, key))
+            # One bound slot for all buttons; the key rides along as a
+            # widget property instead of a partial per button.
+            btn.setProperty("sort-key", key)
+            btn.clicked.connect(self._on_sort_clicked)
             self.sort_buttons[key] = btn
             sort_layout.addWidget(btn)
 
         self.layout.insertWidget(0, sort_widget) # type: ignore
 
+    @pyqtSlot()
+    def _on_sort_clicked(self):
+        """Dispatches a sort-button click via the sender's sort-key property."""
+        self._set_sort_key(self.sender().property("sort-key"))
+
     def _set_sort_key(self, key):
         """Changes the sort key and reloads the task list."""
         if self.sort_key == key:
             return
-        
+
+        # Restyle only the button losing the highlight and the one gaining
+        # it; repolishing the whole row recomputed style for every button.
+        old_btn = self.sort_buttons[self.sort_key]
         self.sort_key = key
-        
-        # Update button styles
-        for k, btn in self.sort_buttons.items():
-            btn.setProperty("data-active", 'true' if k == self.sort_key else 'false')
-            btn.style().polish(btn) # Repolish to apply stylesheet changes
+        new_btn = self.sort_buttons[key]
+        for btn, active in ((old_btn, 'false'), (new_btn, 'true')):
+            btn.setProperty("data-active", active)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
 
         self.current_index = 0
         self.load_tasks()
@@ -1242,33 +1452,64 @@ class TaskCarouselWindow(StyledWindow):
             return task_list
 
         elif self.sort_key == 'Status':
-            # Sort by predefined status order (Not Yet, Pending, Completed)
-            return sorted(
-                task_list, 
-                key=lambda t: self.STATUS_ORDER.get(t.status, 99)
-            )
+            # Sort by predefined status order (Not Yet, Pending, Completed).
+            # Bind the dict lookup once so the key function skips the
+            # self-attribute walk on every comparison.
+            order_of = self.STATUS_ORDER.get
+            return sorted(task_list, key=lambda t: order_of(t.status, 99))
 
         elif self.sort_key == 'DueDate':
             # Sort by due date (closest first. Empty dates go last.)
-            def due_date_sort_key(task):
-                if not task.due_date:
-                    return datetime.max # Put tasks with no date at the end
-                try:
-                    return datetime.strptime(task.due_date, "%Y-%m-%d")
-                except ValueError:
-                    return datetime.max # Invalid dates go at the end too
-            
-            return sorted(task_list, key=due_date_sort_key)
+            # Task.due is parsed once in the setter, so the key is just an
+            # attribute read instead of a strptime per element.
+            return sorted(
+                task_list,
+                key=lambda t: t.due if t.due is not None else date.max
+            )
         
         return task_list
 
     def refresh_tasks(self):
         """Reload tasks and update labels."""
+        # Task data may have changed, so the formatted strings are stale.
+        self._display_cache.clear()
         self.load_tasks()
 
+    def reopen(self, parent_menu=None):
+        """Revives a closed carousel window instead of rebuilding one.
+
+        Undoes what the Back transition left behind (closing flag, faded
+        opacity, emptied sound registry) and refreshes the task rows, so
+        re-entering the view skips the full widget construction.
+        """
+        self._closing = False
+        self.setWindowOpacity(1.0)
+        self.parent_menu = parent_menu
+        if self.parent_menu:
+            self.parent_menu.hide()
+        # A detail view left open at close time would lock navigation.
+        if self.detail_label is not None:
+            self.detail_label.deleteLater()
+            self.detail_label = None
+        self._sounds = [
+            self.back_sound, self.success_sound,
+            self.move_sound, self.select_sound,
+        ]
+        self.refresh_tasks()
+        self.show()
+        self.setFocus()
+
     def load_tasks(self):
         """Loads tasks using the ABSOLUTELY CONCISE format and applies sorting."""
-        
+
+        # Rebuilding the label set repaints once, not once per label.
+        self.setUpdatesEnabled(False)
+        try:
+            self._load_tasks_impl()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _load_tasks_impl(self):
         # 1. Get and sort tasks
         all_tasks = self.manager.tasks
         self.tasks = self._sort_tasks(all_tasks)
@@ -1282,7 +1523,7 @@ class TaskCarouselWindow(StyledWindow):
         # 3. Handle No Tasks case
         if not self.tasks:
             lbl = QLabel("No tasks found", self)
-            lbl.setFont(QFont(FONT_NAME, 24))
+            lbl.setFont(get_font(24))
             lbl.setStyleSheet("color: white;")
             # Align center for this special case
             lbl.setAlignment(Qt.AlignmentFlag.AlignCenter) 
@@ -1293,75 +1534,92 @@ class TaskCarouselWindow(StyledWindow):
             self.labels.append(lbl)
         else:
             for i, task in enumerate(self.tasks):
-                
-                # Severely truncate long titles (Max 20 chars for carousel)
-                display_title = task.title
-                if len(display_title) > 20:
-                    display_title = display_title[:17] + "..." 
-                    
-                # The displayed ID (#i+1) is now the task's position in the *sorted* list.
+
+                # The truncate/upper work is cached per task; only the #ID
+                # (the position in the *sorted* list) changes across sort
+                # toggles, so it is formatted fresh each time.
+                cached = self._display_cache.get(id(task))
+                if cached is None:
+                    # Severely truncate long titles (Max 20 chars for carousel)
+                    display_title = task.title
+                    if len(display_title) > 20:
+                        display_title = display_title[:17] + "..."
+                    cached = (f"[{task.status.upper()}]", display_title)
+                    self._display_cache[id(task)] = cached
+
                 # Final concise text: [STATUS] #ID - TITLE...
-                lbl_text = f"[{task.status.upper()}] #{i+1} - {display_title}"
+                lbl_text = f"{cached[0]} #{i+1} - {cached[1]}"
                 # ------------------------------------
 
-                lbl = QLabel(lbl_text, self)
-                
+                # ShadowLabel paints its own two-pass shadow, avoiding a
+                # blur effect per task label.
+                lbl = ShadowLabel(lbl_text, self)
+
                 # Align Left for the carousel list
                 lbl.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-                
-                lbl.setFont(QFont(FONT_NAME, self.font_size))
-                # Set width to full window width (minus margin) for left alignment to work well
-                lbl.resize(self.width() - 40, self.font_size + 20) 
 
-                shadow = QGraphicsDropShadowEffect()
-                shadow.setBlurRadius(8)
-                shadow.setColor(QColor("black"))
-                shadow.setOffset(0)
-                lbl.setGraphicsEffect(shadow)
+                lbl.setFont(get_font(self.font_size))
+                # Set width to full window width (minus margin) for left alignment to work well
+                lbl.resize(self.width() - 40, self.font_size + 20)
 
-                lbl.setStyleSheet("color: white;")
                 lbl.show()
                 self.labels.append(lbl)
 
         self.current_index = 0
+        # Every freshly built label is shown; update_labels hides the ones
+        # outside the window from here.
+        self._visible = set(range(len(self.labels)))
         self.update_labels()
 
     def update_labels(self):
         center_y = self.height() // 2
-        for i, lbl in enumerate(self.labels):
+
+        # Same windowing as CarouselMenu, one item above and below: hide the
+        # labels that scrolled out and animate only the visible three, so a
+        # key press costs O(1) however long the task list is.
+        visible = {
+            self.current_index + d for d in (-1, 0, 1)
+            if 0 <= self.current_index + d < len(self.labels)
+        }
+        for i in self._visible - visible:
+            self.labels[i].hide()
+        for i in visible - self._visible:
+            self.labels[i].show()
+        self._visible = visible
+
+        # One reused group drives the visible labels off a single timer;
+        # clearing it deletes the previous navigation's animations.
+        group = self._nav_group
+        group.stop()
+        group.clear()
+
+        for i in visible:
+            lbl = self.labels[i]
             distance = i - self.current_index
-            if abs(distance) > 1: # Show only two items above and below the center
-                lbl.hide()
-                continue
-            lbl.show()
 
             target_y = center_y + distance * (self.font_size + self.spacing)
             target_size = self.font_size * (1.3 if distance == 0 else 1.0)
 
             # Animate position
-            anim_pos = QPropertyAnimation(lbl, b"pos", self)
+            anim_pos = QPropertyAnimation(lbl, b"pos")
             anim_pos.setDuration(250)
-            
+
             # Set X position to 20 (left margin) for left alignment
-            target_x = 20 
+            target_x = 20
             anim_pos.setEndValue(QPoint(target_x, target_y - int(target_size)//2))
-            
+
             anim_pos.setEasingCurve(QEasingCurve.Type.OutCubic)
-            self._anims.append(anim_pos)  # Save reference for cleanup
-            anim_pos.start()
+            group.addAnimation(anim_pos)
+
+            # Animate font size with one animation per label
+            group.addAnimation(animate_font_size(
+                lbl, lbl.font().pointSize(), int(target_size), self, start=False
+            ))
 
-            # Animate font size
-            start_size = lbl.font().pointSize()
-            steps = 10
-            delta = (target_size - start_size) / steps
-            for step in range(1, steps + 1):
-                QTimer.singleShot(step * 25, lambda s=start_size + delta*step, l=lbl: l.setFont(QFont(FONT_NAME, int(s))))
+        group.start()
 
     def play_selection_animation(self, label):
         """Pulse the selected label, fade it out, then show task details."""
-        if not hasattr(self, "_anims"):
-            self._anims = []
-
         start_size = label.font().pointSize()
         if start_size <= 0:
             start_size = int(self.font_size)
@@ -1380,33 +1638,42 @@ class TaskCarouselWindow(StyledWindow):
             label.setFont(f)
         size_anim.valueChanged.connect(on_size_changed)
 
-        # Opacity fade
-        opacity_effect = QGraphicsOpacityEffect(label)
-        label.setGraphicsEffect(opacity_effect)
-        op_anim = QVariantAnimation(self)
-        op_anim.setStartValue(1.0)
-        op_anim.setEndValue(0.0)
-        op_anim.setDuration(250)
-        op_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        op_anim.valueChanged.connect(lambda v: opacity_effect.setOpacity(float(v)))
-
-        def after_label_anim():
+        # No per-label opacity effect: the pulse alone reads as the
+        # selection cue, and the effect forced an offscreen composition.
+        def after_pulse():
             # Restore font and clean up
             f = label.font()
             f.setPointSize(start_size)
             label.setFont(f)
-            label.setGraphicsEffect(None)
             label.hide()
             # Now show task details (after animation)
             self.show_task_details()
 
-        # Chain animations
-        size_anim.finished.connect(lambda: op_anim.start())
-        op_anim.finished.connect(after_label_anim)
+        size_anim.finished.connect(after_pulse)
 
-        self._anims.extend([size_anim, op_anim]) # Save references for cleanup
+        track_animation(self._anims, size_anim) # Dropped again on finish
         size_anim.start()
 
+    def _queue_nav(self, delta):
+        """Queues a navigation step, applied on the next throttle tick."""
+        self._nav_delta += delta
+        if not self._nav_timer.isActive():
+            self._nav_timer.start()
+
+    @pyqtSlot()
+    def _apply_nav_delta(self):
+        """Applies the accumulated Up/Down delta as one move."""
+        delta, self._nav_delta = self._nav_delta, 0
+        if not self.tasks:
+            return
+        new_index = max(0, min(len(self.tasks) - 1, self.current_index + delta))
+        if new_index == self.current_index:
+            return
+        self.current_index = new_index
+        self.update_labels()
+        if self.move_sound:
+            self.move_sound.play()
+
     def keyPressEvent(self, event):
         # --- Handle Task Details View (LOCKED NAVIGATION) ---
         if self.detail_label:
@@ -1419,8 +1686,8 @@ class TaskCarouselWindow(StyledWindow):
                 self.detail_label.hide()
                 self.detail_label.deleteLater()
                 self.detail_label = None
-                for lbl in self.labels:
-                    lbl.show()
+                for i in self._visible:
+                    self.labels[i].show()
                 return
             else:
                 # Block all other keys (Up, Down, Enter, etc.) when details are showing
@@ -1429,16 +1696,10 @@ class TaskCarouselWindow(StyledWindow):
 
         if event.key() == Qt.Key.Key_Up:
             if self.tasks:
-                self.current_index = max(0, self.current_index - 1)
-                self.update_labels()
-                if self.move_sound:
-                    self.move_sound.play()
+                self._queue_nav(-1)
         elif event.key() == Qt.Key.Key_Down:
             if self.tasks:
-                self.current_index = min(len(self.tasks) - 1, self.current_index + 1)
-                self.update_labels()
-                if self.move_sound:
-                    self.move_sound.play()
+                self._queue_nav(1)
         elif event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
             if not self.tasks or (len(self.labels) == 1 and self.labels[0].text() == "No tasks found"):
                 return
@@ -1460,17 +1721,21 @@ class TaskCarouselWindow(StyledWindow):
 
         task = self.tasks[self.current_index]
 
-        # Description is at the bottom.
+        # Description is at the bottom. One join over the lines, and the
+        # tags are only joined when the task actually has any.
+        tags_str = ", ".join(task.tags) if task.tags else "-"
         self.detail_label = QLabel(
-            f"Title: {task.title}\n"
-            f"Status: {task.status}\n"
-            f"Due Date: {task.due_date}\n"
-            f"Folder: {task.folder or '-'}\n"
-            f"Tags: {', '.join(task.tags) or '-'}\n"
-            f"Description: {task.description or '-'}", 
+            "\n".join([
+                f"Title: {task.title}",
+                f"Status: {task.status}",
+                f"Due Date: {task.due_date}",
+                f"Folder: {task.folder or '-'}",
+                f"Tags: {tags_str}",
+                f"Description: {task.description or '-'}",
+            ]),
             self
         )
-        self.detail_label.setFont(QFont(FONT_NAME, 24))
+        self.detail_label.setFont(get_font(24))
         self.detail_label.setStyleSheet("color: white;")
         
         # Align Left and Top for the detailed view
@@ -1495,9 +1760,9 @@ class TaskCarouselWindow(StyledWindow):
         if hasattr(self, 'back_button'):
             self.back_button.raise_()
 
-        # Hide task labels
-        for lbl in self.labels:
-            lbl.hide()
+        # Hide the task labels that are actually on screen
+        for i in self._visible:
+            self.labels[i].hide()
 
 # -----------------  Custom Styled Task Selection Dialog ----------------- #
 class TaskSelectionDialog(QDialog):
@@ -1536,35 +1801,29 @@ class TaskSelectionDialog(QDialog):
 
         # --- Task List Display ---
         self.layout.addWidget(self._make_styled_label(f"**Current Tasks (1-based index):**", 24)) # type: ignore
-        
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setMinimumHeight(350)
-        # Styled scroll area background
-        scroll.setStyleSheet("background: rgba(255, 255, 255, 0.05); border: 1px solid rgba(255, 255, 255, 0.2); border-radius: 10px;")
-        
-        container = QFrame()
-        container_layout = QVBoxLayout()
-        container_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-        container_layout.setSpacing(5)
-        container_layout.setContentsMargins(15, 15, 15, 15)
-        container.setLayout(container_layout)
-        
-        # Populate task list
-        all_tasks = self.manager.tasks 
-        if not all_tasks:
-            container_layout.addWidget(self._make_styled_label("No tasks available.", 20))
-        else:
-            for i, task in enumerate(all_tasks):
-                # Bold index for readability
-                lbl = self._make_styled_label(
-                    f"**{i+1}**: {task.title} (Status: {task.status})",
-                    20
-                )
-                container_layout.addWidget(lbl)
-        
-        scroll.setWidget(container)
-        self.layout.addWidget(scroll) # type: ignore
+
+        # Model/view instead of one styled QLabel (plus shadow effect) per
+        # task in a QScrollArea: the view only paints visible rows, so the
+        # dialog opens in constant time however long the list is.
+        all_tasks = self.manager.tasks
+        rows = [
+            f"{i+1}: {task.title} (Status: {task.status})"
+            for i, task in enumerate(all_tasks)
+        ] or ["No tasks available."]
+        self.task_model = TaskListModel(rows, self)
+
+        task_view = QListView()
+        task_view.setModel(self.task_model)
+        task_view.setFont(get_font(20))
+        task_view.setMinimumHeight(350)
+        task_view.setStyleSheet(
+            "color: white; background: rgba(255, 255, 255, 0.05); "
+            "border: 1px solid rgba(255, 255, 255, 0.2); border-radius: 10px;"
+        )
+        task_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        task_view.setUniformItemSizes(True)
+        task_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.layout.addWidget(task_view) # type: ignore
         
         # --- Index Input ---
         self.layout.addWidget(self._make_styled_label(f"Enter the **index** of the task to {action_name.lower()}:", 20)) # type: ignore
@@ -1589,81 +1848,50 @@ class TaskSelectionDialog(QDialog):
         
     # Helper methods replicating StyledWindow's style logic
     def _make_styled_label(self, text, font_size=24):
+        # No drop-shadow effect: each one forces the label through an
+        # offscreen blur pass on every repaint, and the translucent dialog
+        # background already separates the text from what is behind it.
         lbl = QLabel(text)
-        lbl.setFont(QFont(FONT_NAME, font_size))
+        lbl.setFont(get_font(font_size))
         lbl.setStyleSheet("color: white;")
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(8)
-        shadow.setColor(QColor("black"))
-        shadow.setOffset(0)
-        lbl.setGraphicsEffect(shadow)
         lbl.setWordWrap(True)
         return lbl
 
     def _make_styled_button(self, text, font_size=24):
         btn = QPushButton(text)
-        btn.setFont(QFont(FONT_NAME, font_size))
-        btn.setStyleSheet(
-            """
-            QPushButton {
-                color: #FFFFFF;
-                background-color: rgba(255, 255, 255, 0.1); 
-                border: 1px solid rgba(255, 255, 255, 0.4);
-                border-radius: 12px;
-                padding: 10px 20px; 
-                outline: 0px; 
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-                border: 1px solid rgba(255, 255, 255, 0.8);
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 0, 0, 0.2);
-                border-style: inset;
-                border: 1px solid rgba(255, 255, 255, 0.3);
-            }
-            """
-        )
+        btn.setFont(get_font(font_size))
+        btn.setObjectName("dialogButton")  # styled by DIALOG_BUTTON_QSS
         return btn
         
     def _setup_styled_input(self):
         input_field = QLineEdit()
-        input_field.setFont(QFont(FONT_NAME, 24))
-        input_field.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0,0,0,0);
-                color: white;
-                border: none;
-                selection-background-color: rgba(255,255,255,50%);
-                padding: 5px;
-            }
-        """)
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor("black"))
-        shadow.setOffset(0)
-        input_field.setGraphicsEffect(shadow)
+        input_field.setFont(get_font(24))
+        input_field.setObjectName("wizardInput")  # styled by WIZARD_INPUT_QSS
 
-        # Connect typing sound
+        # Connect typing sound directly to the bound method: no closure
+        # allocation, and one less Python frame per keystroke.
         if self.typing_sound:
-            input_field.textChanged.connect(lambda: self.typing_sound.play()) # type: ignore
-        
+            input_field.textEdited.connect(self.typing_sound.play) # type: ignore
+
         return input_field
 
+    @pyqtSlot()
     def _validate_and_accept(self):
         id_str = self.input_field.text().strip()
-        all_tasks = self.manager.tasks 
+        # Bound once: this slot runs on every Enter press.
+        all_tasks = self.manager.tasks
+        task_count = len(all_tasks)
 
         if not id_str:
-            send_notification("Error", "Please enter a task index.")
+            notify_async("Error", "Please enter a task index.")
             if self.error_sound: self.error_sound.play()
             return
-            
+
         try:
             user_index = int(id_str)
             list_index = user_index - 1
-            
-            if 0 <= list_index < len(all_tasks):
+
+            if 0 <= list_index < task_count:
                 self.result_index = list_index
                 
                 if self.success_sound:
@@ -1672,28 +1900,25 @@ class TaskSelectionDialog(QDialog):
                 
                 self.accept()
             else:
-                send_notification(
+                notify_async(
                     "Error",
-                    f"Invalid index: Task #{user_index} does not exist. Range: 1 to {len(all_tasks)}."
+                    f"Invalid index: Task #{user_index} does not exist. Range: 1 to {task_count}."
                 )
                 if self.error_sound: self.error_sound.play()
                 
         except ValueError:
-            send_notification("Error", "Invalid input. Please enter a number.")
+            notify_async("Error", "Invalid input. Please enter a number.")
             if self.error_sound: self.error_sound.play()
             
     def reject(self):
         """Override reject to ensure sound cleanup on cancel/close."""
-        if hasattr(self, 'error_sound') and self.error_sound:
-            self.error_sound.deleteLater()
-            
-        if hasattr(self, 'typing_sound') and self.typing_sound:
-            self.typing_sound.deleteLater()
-            
-        if hasattr(self, 'success_sound') and self.success_sound:
-            self.success_sound.deleteLater()
-        # =============================================
-        
+        # The sound objects are shared app-wide (load_sound cache), so they
+        # are only stopped here — deleting them would break other windows.
+        # __init__ always assigns all three, so no hasattr guards needed.
+        for sound in (self.error_sound, self.typing_sound, self.success_sound):
+            if sound:
+                sound.stop()
+
         super().reject()
 # ----------------- END Custom Styled Task Selection Dialog ----------------- #
 
@@ -1715,7 +1940,16 @@ class GUIHandler:
             # Use QMessageBox for this initial list check as it's outside the main flow
             QMessageBox.information(parent, "Task List", f"There are no tasks to {action_name.lower()}.")
             return None, None, None
-            
+
+        if len(all_tasks) == 1:
+            # Only one possible choice: skip building the whole dialog and
+            # select it directly, keeping the same confirmation banner.
+            notify_async(
+                "Task Selected",
+                f"You selected task #1: {all_tasks[0].title}"
+            )
+            return 0, all_tasks[0], parent
+
         # 1. Create and show the new styled dialog
         dialog = TaskSelectionDialog(self.manager, action_name, parent_menu=parent)
         
@@ -1730,7 +1964,7 @@ class GUIHandler:
             parent.show()
             
             # Use a notification for the final confirmation (more consistent style)
-            send_notification(
+            notify_async(
                 f"Task Selected",
                 f"You selected task #{list_index + 1}: {selected_task.title}" # type: ignore
             )
@@ -1750,9 +1984,12 @@ class GUIHandler:
         self.open_window.destroyed.connect(self._refresh_carousel)
 
     def view_tasks_gui(self, menu):
-        # Always create a fresh carousel window to ensure tasks are current
-        if self.open_window and isinstance(self.open_window, TaskCarouselWindow):
-            self.open_window.close() # Close existing one safely
+        # Reuse the carousel window across opens: refresh_tasks re-reads
+        # the manager state, which is much cheaper than rebuilding every
+        # label (and its animations) from scratch each time.
+        if isinstance(self.open_window, TaskCarouselWindow):
+            self.open_window.reopen(parent_menu=menu)
+            return
         self.open_window = TaskCarouselWindow(self.manager, parent_menu=menu)
         self.open_window.show()
         self.open_window.setFocus()
@@ -1790,8 +2027,8 @@ class GUIHandler:
         
         # The sound is played by CarouselMenu.keyPressEvent.
         # We only need the delayed quit to ensure the sound has time to play.
-        if hasattr(menu, 'carousel_menu') and menu.carousel_menu.exit_sound:
-            QTimer.singleShot(100, lambda: QApplication.instance().quit()) # type: ignore
+        if menu.carousel_menu is not None and menu.carousel_menu.exit_sound:
+            QTimer.singleShot(100, QApplication.instance().quit) # type: ignore
         else:
             QApplication.instance().quit() # type: ignore
 
@@ -1809,6 +2046,9 @@ if __name__ == "__main__":
     os.environ["QT_MAC_WANTS_LAYER"] = "1"
     app = QApplication(sys.argv)
 
+    # Parse the shared widget styles once; widgets opt in by object name.
+    app.setStyleSheet(APP_QSS)
+
     # --- Set Application Icon ---
     icon_path = os.path.join(os.path.dirname(__file__), ICON_FILE)
     if os.path.exists(icon_path):
@@ -1839,33 +2079,23 @@ if __name__ == "__main__":
         print("Safe font load failed:", e)
         FONT_NAME = "Menlo"
 
-    app.setFont(QFont(FONT_NAME, 20)) # Set a base font family
+    app.setFont(get_font(20)) # Set a base font family
 
     # --- Step : show loading animation first ---
-    try:
-        # Instantiate the custom loading screen, PASSING THE DURATION
-        splash = PixelLoadingOverlay(LOADING_DURATION_MS) 
-        splash.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.Tool)
-        splash.show()
-    except NameError:
-        # Fallback if PixelLoadingOverlay is not found (e.g., if loading_bar.py is missing)
-        splash = QWidget()
-        splash.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.Tool)
-        splash.resize(300, 100)
-        splash.setStyleSheet("background-color: black;")
-        
-        loading_label = QLabel("LOADING...", splash)
-        loading_label.setFont(QFont(FONT_NAME, 24))
-        loading_label.setStyleSheet("color: white;")
-        loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        loading_label.resize(300, 100)
-        splash.show()
+    # Instantiate the custom loading screen, PASSING THE DURATION
+    splash = PixelLoadingOverlay(LOADING_DURATION_MS)
+    splash.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.Tool)
+    splash.show()
     # -------------------------------------------------------------------
 
+    # Warm the asset caches behind the splash: singleShot(0, ...) lets the
+    # splash paint its first frame before the disk reads happen.
+    QTimer.singleShot(0, preload_assets)
+
 
     # --- Step : run main GUI (scheduled to run after loading finish) ---
     def start_main_app():
-        manager = TaskManager()
+        manager = get_manager()
         gui = GUIHandler(manager)
 
         options = [
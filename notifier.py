@@ -1,5 +1,40 @@
 import subprocess
 
+from typing import List, Tuple
+
+# Static AppleScript body: titles and messages arrive as argv items, so
+# quotes or backslashes in task text cannot break out of the script, and
+# osascript never has to parse a freshly built source string per call.
+# argv holds alternating title/message pairs.
+_NOTIFY_SCRIPT = """\
+on run argv
+    repeat with i from 1 to (count of argv) by 2
+        display notification (item (i + 1) of argv) with title (item i of argv) sound name "Ping"
+    end repeat
+end run"""
+
+
+def send_notifications(notifications: List[Tuple[str, str]]) -> None:
+    """
+    Sends several macOS desktop notifications with one AppleScript invocation.
+
+    Spawning osascript once per notification costs a full process launch each
+    time; batching the pairs into a single run amortizes that cost.
+
+    Args:
+        notifications (list): (title, message) pairs to display.
+
+    Returns:
+        None
+    """
+    if not notifications:
+        return
+    args: List[str] = []
+    for title, message in notifications:
+        args.extend((title, message))
+    _spawn_osascript(args)
+
+
 def send_notification(title: str, message: str) -> None:
     """
     Sends a macOS desktop notification using AppleScript.
@@ -11,7 +46,26 @@ def send_notification(title: str, message: str) -> None:
     Returns:
         None
     """
-    subprocess.run([
-        "osascript", "-e",
-        f'display notification "{message}" with title "{title}" sound name "Ping" '
-    ])
+    _spawn_osascript([title, message])
+
+
+def _spawn_osascript(args: List[str]) -> None:
+    """
+    Runs the notification script without waiting for it to finish.
+
+    subprocess.run blocked the caller for the 30-100 ms osascript takes to
+    post to Notification Center, which stalls the Qt event loop when a
+    notification fires from a click handler.
+
+    Args:
+        args (list): Alternating title/message argv items for the script.
+
+    Returns:
+        None
+    """
+    subprocess.Popen(
+        ["osascript", "-e", _NOTIFY_SCRIPT, *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+    )
@@ -2,13 +2,14 @@
 import pytest
 from unittest.mock import patch
 
+import subprocess
 import threading
 import time
 from typing import Set, Optional
 
 from task import Task
 from task_manager import TaskManager
-from notifier import send_notification
+from notifier import send_notification, send_notifications
 from utils.background import start_background_notifier
 from utils.helpers import notify_due_tasks
 
@@ -31,19 +32,49 @@ def sample_manager() -> TaskManager:
 
 def test_send_notification_calls_subprocess() -> None:
     """
-    Tests that send_notification calls subprocess.run with the correct arguments.
+    Tests that send_notification spawns osascript without waiting on it.
     """
-    with patch("subprocess.run") as mock_run:
+    with patch("subprocess.Popen") as mock_popen:
         send_notification("Hello", "World")
 
-        # Verify subprocess.run was called once
-        mock_run.assert_called_once_with([
-            "osascript", "-e",
-            'display notification "World" with title "Hello" sound name "Ping" '
-        ])
+        # Verify the process was spawned once, fire-and-forget, with the
+        # title and message passed as argv items rather than script text
+        mock_popen.assert_called_once()
+        argv = mock_popen.call_args[0][0]
+        assert argv[:2] == ["osascript", "-e"]
+        assert argv[3:] == ["Hello", "World"]
+        assert mock_popen.call_args[1] == {
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.DEVNULL,
+            "close_fds": True,
+        }
 
 
 
+def test_send_notifications_batches_into_one_call() -> None:
+    """
+    Tests that send_notifications sends all notifications with a single
+    osascript invocation.
+    """
+    with patch("subprocess.Popen") as mock_popen:
+        send_notifications([("Overdue Task", "'A' is past due!"),
+                            ("Task Reminder", "'B' is due tomorrow!")])
+
+        mock_popen.assert_called_once()
+        argv = mock_popen.call_args[0][0]
+        assert "'A' is past due!" in argv
+        assert "'B' is due tomorrow!" in argv
+
+
+def test_send_notifications_empty_batch_skips_subprocess() -> None:
+    """
+    Tests that an empty batch does not spawn a subprocess at all.
+    """
+    with patch("subprocess.Popen") as mock_popen:
+        send_notifications([])
+        mock_popen.assert_not_called()
+
+
 # def test_notify_due_tasks_calls_send_notification(sample_manager: TaskManager) -> None:
 #     """
 #     Tests that notify_due_tasks calls send_notification for tasks that are overdue or due soon.
@@ -86,6 +86,31 @@ def test_edit_task(sample_tasks: List[Task]) -> None:
     assert task.description == "Updated"
 
 
+def test_edit_and_delete_by_index(sample_tasks: List[Task]) -> None:
+    """
+    Test the index-based edit and delete paths used by the GUI wizards.
+
+    Args:
+        sample_tasks (List[Task]): A list of tasks provided by the fixture.
+    """
+    manager = TaskManager(filepath=TEST_FILE)
+    for task in sample_tasks:
+        manager.add_task(task)
+
+    manager.edit_task_by_index(0, {"title": "Renamed", "status": "Completed"})
+    task = manager.find_task("Renamed")
+    assert task is not None
+    assert task.status == "Completed"
+
+    manager.delete_task_by_index(0)
+    assert manager.find_task("Renamed") is None
+    assert len(manager.tasks) == 2
+
+    # Out-of-range indexes are ignored
+    manager.delete_task_by_index(10)
+    assert len(manager.tasks) == 2
+
+
 def test_view_tasks_with_filter(sample_tasks: List[Task]) -> None:
     """
     Test viewing tasks, both with and without filtering.
@@ -108,6 +133,115 @@ def test_view_tasks_with_filter(sample_tasks: List[Task]) -> None:
     assert len(all_tasks) == 3
 
 
+def test_defer_saves_batches_writes(sample_tasks: List[Task]) -> None:
+    """
+    Test that mutations inside defer_saves are written out once on exit.
+
+    Args:
+        sample_tasks (List[Task]): A list of tasks provided by the fixture.
+    """
+    manager = TaskManager(filepath=TEST_FILE)
+
+    with manager.defer_saves():
+        for task in sample_tasks:
+            manager.add_task(task)
+        # Nothing hits the disk while the block is open
+        assert not os.path.exists(TEST_FILE)
+
+    manager2 = TaskManager(filepath=TEST_FILE)
+    assert len(manager2.tasks) == 3
+
+
+def test_load_legacy_json_array(sample_tasks: List[Task]) -> None:
+    """
+    Test that a legacy tasks file containing a single JSON array still loads
+    and is migrated to the JSONL format.
+
+    Args:
+        sample_tasks (List[Task]): A list of tasks provided by the fixture.
+    """
+    with open(TEST_FILE, "w") as f:
+        json.dump([t.to_dict() for t in sample_tasks], f, indent=4)
+
+    manager = TaskManager(filepath=TEST_FILE)
+    assert len(manager.tasks) == 3
+    assert manager.tasks[0].title == "Task 1"
+
+    # The file should now be JSONL: one JSON object per line
+    with open(TEST_FILE) as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    assert len(lines) == 3
+    assert json.loads(lines[0])["title"] == "Task 1"
+
+
+def test_duplicate_titles_rejected(sample_tasks: List[Task]) -> None:
+    """
+    Test that adds and renames colliding with an existing title raise,
+    keeping every task reachable through the title indexes.
+
+    Args:
+        sample_tasks (List[Task]): A list of tasks provided by the fixture.
+    """
+    manager = TaskManager(filepath=TEST_FILE)
+    for task in sample_tasks:
+        manager.add_task(task)
+
+    # Case-insensitive collision on add
+    with pytest.raises(ValueError):
+        manager.add_task(Task(title="task 1", description="", due_date="2025-11-09"))
+
+    # Renaming onto another task's title is rejected and changes nothing
+    with pytest.raises(ValueError):
+        manager.edit_task("Task 1", {"title": "Task 2"})
+    assert manager.find_task("Task 1") is not None
+    assert len(manager.tasks) == 3
+
+
+def test_failed_edit_leaves_task_untouched(sample_tasks: List[Task]) -> None:
+    """
+    Test that an edit with an invalid due date raises without applying any
+    of the other new values.
+
+    Args:
+        sample_tasks (List[Task]): A list of tasks provided by the fixture.
+    """
+    manager = TaskManager(filepath=TEST_FILE)
+    for task in sample_tasks:
+        manager.add_task(task)
+
+    with pytest.raises(ValueError):
+        manager.edit_task("Task 1", {"title": "Renamed", "due_date": "garbage"})
+
+    task = manager.find_task("Task 1")
+    assert task is not None
+    assert task.title == "Task 1"
+    assert task.due_date == "2025-11-01"
+    assert manager.find_task("Renamed") is None
+
+
+def test_view_tasks_reloads_only_on_file_change(sample_tasks: List[Task]) -> None:
+    """
+    Test that view_tasks skips re-reading the file when it has not changed,
+    but still picks up edits made by another manager instance.
+
+    Args:
+        sample_tasks (List[Task]): A list of tasks provided by the fixture.
+    """
+    manager = TaskManager(filepath=TEST_FILE)
+    for task in sample_tasks:
+        manager.add_task(task)
+
+    # The file is unchanged, so the in-memory list must be kept as-is
+    before = manager.view_tasks()
+    assert manager.view_tasks() is before
+
+    # A write from elsewhere bumps the mtime and forces a reload
+    other = TaskManager(filepath=TEST_FILE)
+    os.utime(TEST_FILE, ns=(0, 0))  # ensure the mtime actually differs
+    other.delete_task("Task 2")
+    assert len(manager.view_tasks()) == 2
+
+
 def test_find_task(sample_tasks: List[Task]) -> None:
     """
     Test finding a task by title (case-insensitive) and returning None for missing tasks.
@@ -1,12 +1,27 @@
-from typing import List, Optional, Dict, Any
+from typing import ClassVar, List, Optional, Dict, Any
 
-from datetime import datetime
+from datetime import date, datetime
+
+# Hashed once at import; membership checks are O(1) instead of scanning a
+# tuple literal rebuilt on every Task construction.
+_VALID_STATUSES = frozenset(("Not Yet", "Pending", "Completed"))
 
 
 class Task():
     """
     Represents a task with title, description, due date, tags, status, and folder.
     """
+
+    # Fixed slots instead of a per-instance __dict__: smaller objects and
+    # faster attribute access, which adds up when thousands of tasks are
+    # rebuilt on every load.
+    __slots__ = ("title", "description", "tags", "status", "folder",
+                 "_due_date", "_due")
+
+    # Terminal status, exposed so filter loops can compare the attribute
+    # directly instead of paying a method call per task.
+    COMPLETED: ClassVar[str] = "Completed"
+
     def __init__(
         self,
         title: str, 
@@ -29,25 +44,50 @@ class Task():
         """
         if not title.strip():
             raise ValueError("Title can not be empty")
-        
-        if due_date:
-            try:
-                datetime.strptime(due_date, "%Y-%m-%d")
 
-            except ValueError:
-                raise ValueError("Due date must be in YYYY-MM-DD format")
-            
-        
-        if status not in ("Not Yet", "Pending", "Completed"):
+        if status not in _VALID_STATUSES:
             raise ValueError(f"Status: {status} is invalid")
-        
+
         self.title = title
         self.description = description
-        self.due_date = due_date 
+        self.due_date = due_date
         self.tags = tags or []
         self.status = status
         self.folder = folder
 
+    @property
+    def due_date(self) -> str:
+        """str: The due date in 'YYYY-MM-DD' format, or an empty value if unset."""
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value: str) -> None:
+        """
+        Sets the due date, parsing it once so date checks avoid repeated strptime.
+
+        Args:
+            value (str): The due date in 'YYYY-MM-DD' format.
+
+        Raises:
+            ValueError: If the value is not a valid 'YYYY-MM-DD' date.
+        """
+        if value:
+            try:
+                # fromisoformat is a C-level parser, far cheaper than
+                # interpreting a strptime format string.
+                self._due = date.fromisoformat(value)
+
+            except ValueError:
+                raise ValueError("Due date must be in YYYY-MM-DD format")
+        else:
+            self._due = None
+        self._due_date = value
+
+    @property
+    def due(self) -> Optional[date]:
+        """Optional[date]: The parsed due date, or None if the task has no due date."""
+        return self._due
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Converts the Task object into a dictionary.
@@ -85,34 +125,39 @@ class Task():
             folder=data.get("folder")
         )
 
-    def is_due_soon(self, days: int =1) -> bool:
+    def is_due_soon(self, days: int =1, today: Optional[date] = None) -> bool:
         """
         Checks if the task is due within a given number of days.
 
         Args:
             days (int, optional): The number of days to check against. Defaults to 1.
+            today (date, optional): Precomputed current date. Callers scanning many
+                tasks can pass it once instead of recomputing per task.
 
         Returns:
             bool: True if the task is due within the given number of days, False otherwise.
         """
 
-        if self.due_date:
-            due = datetime.strptime(self.due_date, "%Y-%m-%d").date()
-            now = datetime.now().date()
-            return  0 <= (due - now).days <= days
+        if self._due is not None:
+            if today is None:
+                today = datetime.now().date()
+            return 0 <= (self._due - today).days <= days
         return False
-        
-    def is_overdue(self) -> bool:
+
+    def is_overdue(self, today: Optional[date] = None) -> bool:
         """
         Determines if the task is past its due date.
 
+        Args:
+            today (date, optional): Precomputed current date, as in is_due_soon.
+
         Returns:
             bool: True if the task is overdue, False otherwise.
         """
-        if self.due_date:
-            due = datetime.strptime(self.due_date, "%Y-%m-%d").date()
-            today = datetime.now().date()
-            return due < today
+        if self._due is not None:
+            if today is None:
+                today = datetime.now().date()
+            return self._due < today
         return False
     
     def is_not_completed(self) -> bool:
@@ -122,5 +167,5 @@ class Task():
         Returns:
             bool: True if the task status is not 'Completed', False otherwise.
         """
-        return self.status != "Completed"
+        return self.status != Task.COMPLETED
     
\ No newline at end of file
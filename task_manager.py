@@ -1,6 +1,13 @@
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Iterator, List, Optional, Tuple, Dict, Any
+from contextlib import contextmanager
+from operator import attrgetter
 import json, os
 
+try:
+    import orjson  # Rust-backed JSON, much faster than the stdlib for large files
+except ImportError:
+    orjson = None
+
 from task import Task
 
 class TaskManager:
@@ -8,20 +15,43 @@ class TaskManager:
     Manages a collection of Task objects, providing functionality to
     load, save, add, edit, and delete tasks.
     """
-    def __init__(self, filepath: str = "tasks.json") -> None:
+    def __init__(self, filepath: str = "tasks.jsonl") -> None:
         """
-        Initialize the TaskManager and load tasks from a JSON file.
+        Initialize the TaskManager and load tasks from a JSON Lines file.
 
         Args:
-            filepath (str): The location of the JSON file storing tasks.
+            filepath (str): The location of the JSONL file storing tasks.
         """
 
         self.filepath = filepath
+        self._defer_depth: int = 0
+        self._dirty: bool = False
+        self._mtime_ns: Optional[int] = None
         self.tasks: List[Task] = self.load_tasks()
+        self._mtime_ns = self._stat_mtime()
+        self._by_title: Dict[str, Task] = {}
+        self._by_lower_title: Dict[str, Task] = {}
+        self._by_status: Dict[str, List[Task]] = {}
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """
+        Rebuild the lookup indexes: title -> Task for O(1) mutation paths,
+        a lowercase variant backing the case-insensitive find_task, and
+        status -> tasks for the common status filter in view_tasks.
+        """
+        self._by_title = {t.title: t for t in self.tasks}
+        self._by_lower_title = {t.title.lower(): t for t in self.tasks}
+        self._by_status = {}
+        for t in self.tasks:
+            self._by_status.setdefault(t.status, []).append(t)
 
     def load_tasks(self) -> List[Task]:
         """
-        Load tasks from the JSON file.
+        Load tasks from the JSONL file (one JSON object per line).
+
+        Legacy files containing a single JSON array are still readable and
+        are migrated to JSONL on first load.
 
         Returns:
             list: A list of Task objects loaded from the file.
@@ -29,29 +59,148 @@ class TaskManager:
 
         if not os.path.exists(self.filepath):
             return []
-        
-        with open(self.filepath, "r") as f:
-            data = json.load(f)
-        return [Task.from_dict(item) for item in data]
+
+        with open(self.filepath, "rb") as f:
+            raw = f.read()
+
+        if not raw.strip():
+            return []
+
+        loads = orjson.loads if orjson is not None else json.loads
+
+        if raw.lstrip().startswith(b"["):
+            # Legacy format: one JSON array for the whole file. Parse it and
+            # rewrite as JSONL so add_task can append in O(1) from now on.
+            tasks = [Task.from_dict(item) for item in loads(raw)]
+            self._write_all(tasks)
+            return tasks
+
+        return [Task.from_dict(loads(line)) for line in raw.splitlines() if line.strip()]
 
     def save_tasks(self) -> None:
         """
-        Save the current list of tasks to the JSON file.
+        Save the current list of tasks to the JSONL file.
+
+        Inside a defer_saves block the write is only marked pending; the file
+        is rewritten once when the block exits.
+        """
+
+        if self._defer_depth:
+            self._dirty = True
+            return
+        self._write_all(self.tasks)
+
+    @contextmanager
+    def defer_saves(self) -> Iterator["TaskManager"]:
+        """
+        Batch several mutations into a single file write.
+
+        Usage:
+            with manager.defer_saves():
+                manager.add_task(a)
+                manager.delete_task("old")
+
+        Returns:
+            Iterator[TaskManager]: Yields the manager itself.
+        """
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0 and self._dirty:
+                self._dirty = False
+                self._write_all(self.tasks)
+
+    def _write_all(self, tasks: List[Task]) -> None:
+        """
+        Rewrite the whole file atomically, one JSON object per line.
+
+        The lines go to a sibling temp file that only replaces the real one
+        after an fsync, so a crash mid-write can never leave a truncated or
+        half-serialized tasks file as the sole copy.
+
+        Args:
+            tasks (list): The Task objects to write.
+        """
+        tmp_path = self.filepath + ".tmp"
+        with open(tmp_path, "wb") as f:
+            # One joined buffer, one write() syscall, instead of a write per
+            # task line.
+            f.write(b"".join(map(self._dump_line, tasks)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.filepath)
+        self._mtime_ns = self._stat_mtime()
+
+    def _stat_mtime(self) -> Optional[int]:
         """
+        Read the file's modification time in nanoseconds.
+
+        Returns:
+            int or None: st_mtime_ns, or None if the file does not exist.
+        """
+        try:
+            return os.stat(self.filepath).st_mtime_ns
+        except OSError:
+            return None
+
+    def _reload_if_changed(self) -> None:
+        """
+        Reload from disk only when the file changed since the last read or
+        write. A stat call replaces re-parsing the entire file on every
+        view, which matters once the task list grows.
+        """
+        mtime = self._stat_mtime()
+        if mtime == self._mtime_ns:
+            return
+        self._mtime_ns = mtime
+        self.tasks = self.load_tasks()
+        self._reindex()
+
+    @staticmethod
+    def _dump_line(task: Task) -> bytes:
+        """
+        Serialize a single task to one JSONL line.
+
+        Args:
+            task (Task): The Task object to serialize.
 
-        with open(self.filepath, "w") as f:
-            json.dump([task.to_dict() for task in self.tasks], f, indent=4)
+        Returns:
+            bytes: The encoded line, newline-terminated.
+        """
+        if orjson is not None:
+            return orjson.dumps(task.to_dict()) + b"\n"
+        return json.dumps(task.to_dict()).encode("utf-8") + b"\n"
 
     def add_task(self, task: Task) -> None:
         """
-        Add a new task and save it to the file.
+        Add a new task and append it to the file.
+
+        Appending one line is O(1) regardless of how many tasks already
+        exist, unlike the full rewrite still used by delete/edit.
 
         Args:
             task (Task): The Task object to be added.
+
+        Raises:
+            ValueError: If a task with the same title (case-insensitive)
+                already exists. The title indexes key one task per title,
+                so duplicates would make all but one of them unreachable.
         """
-        
+        if task.title.lower() in self._by_lower_title:
+            raise ValueError(f"A task titled '{task.title}' already exists")
+
         self.tasks.append(task)
-        self.save_tasks()
+        self._by_title[task.title] = task
+        self._by_lower_title[task.title.lower()] = task
+        self._by_status.setdefault(task.status, []).append(task)
+        if self._defer_depth:
+            self._dirty = True
+            return
+        with open(self.filepath, "ab") as f:
+            f.write(self._dump_line(task))
+        self._mtime_ns = self._stat_mtime()
 
     def delete_task(self, title: str) -> None:
         """
@@ -60,7 +209,15 @@ class TaskManager:
         Args:
             title (str): The title of the task to delete.
         """
-        self.tasks = [t for t in self.tasks if t.title != title]
+        task = self._by_title.pop(title, None)
+        if task is None:
+            return
+        self._by_lower_title.pop(title.lower(), None)
+        if task in self._by_status.get(task.status, []):
+            self._by_status[task.status].remove(task)
+        # Remove the indexed object in place rather than rebuilding the whole
+        # list; titles are unique, so there is exactly one entry to drop.
+        self.tasks.remove(task)
         self.save_tasks()
 
     def edit_task(self, title: str, new_data: Dict[str, Any]) -> None:
@@ -71,10 +228,79 @@ class TaskManager:
             title (str): The title of the task to edit.
             new_data (dict): A dictionary containing updated task values.
         """
-        for t in self.tasks:
-            if t.title == title:
-                for key, value in new_data.items():
-                    setattr(t, key, value)
+        task = self._by_title.get(title)
+        if task is None:
+            return
+        self._apply_edit(task, new_data)
+
+    def edit_task_by_index(self, index: int, new_data: Dict[str, Any]) -> None:
+        """
+        Edit the task at a list position, skipping the title lookup.
+
+        Callers that already hold a task's index (the GUI wizards) can use
+        this without round-tripping through the title, which also stays
+        correct when the title itself is being edited.
+
+        Args:
+            index (int): Zero-based position of the task in self.tasks.
+            new_data (dict): A dictionary containing updated task values.
+        """
+        if not 0 <= index < len(self.tasks):
+            return
+        self._apply_edit(self.tasks[index], new_data)
+
+    def _apply_edit(self, task: Task, new_data: Dict[str, Any]) -> None:
+        """
+        Apply updated values to a task, maintain the indexes, and save.
+
+        Args:
+            task (Task): The task object to update in place.
+            new_data (dict): A dictionary containing updated task values.
+
+        Raises:
+            ValueError: If the new title would collide with another task's
+                title (case-insensitive), or the new due date is invalid.
+                A failed edit leaves the task and indexes untouched.
+        """
+        old_title = task.title
+        old_status = task.status
+        new_title = new_data.get("title")
+        if (new_title is not None
+                and new_title.lower() != old_title.lower()
+                and new_title.lower() in self._by_lower_title):
+            raise ValueError(f"A task titled '{new_title}' already exists")
+        # due_date is the only validating setter; apply it first so a bad
+        # value raises before any other field has been mutated.
+        if "due_date" in new_data:
+            task.due_date = new_data["due_date"]
+        for key, value in new_data.items():
+            if key != "due_date":
+                setattr(task, key, value)
+        if task.status != old_status:
+            if task in self._by_status.get(old_status, []):
+                self._by_status[old_status].remove(task)
+            self._by_status.setdefault(task.status, []).append(task)
+        if task.title != old_title:
+            del self._by_title[old_title]
+            del self._by_lower_title[old_title.lower()]
+            self._by_title[task.title] = task
+            self._by_lower_title[task.title.lower()] = task
+        self.save_tasks()
+
+    def delete_task_by_index(self, index: int) -> None:
+        """
+        Delete the task at a list position, skipping the title lookup.
+
+        Args:
+            index (int): Zero-based position of the task in self.tasks.
+        """
+        if not 0 <= index < len(self.tasks):
+            return
+        task = self.tasks.pop(index)
+        self._by_title.pop(task.title, None)
+        self._by_lower_title.pop(task.title.lower(), None)
+        if task in self._by_status.get(task.status, []):
+            self._by_status[task.status].remove(task)
         self.save_tasks()
 
     def view_tasks(self, filter_by: Optional[Tuple[str, Any]] = None) -> List[Task]:
@@ -87,11 +313,17 @@ class TaskManager:
         Returns:
             list: A list of Task objects.
         """
-        self.tasks = self.load_tasks()
-        
+        self._reload_if_changed()
+
         if not filter_by:
             return self.tasks
-        return [t for t in self.tasks if getattr(t, filter_by[0]) == filter_by[1]]
+        if filter_by[0] == "status":
+            return list(self._by_status.get(filter_by[1], []))
+        # attrgetter resolves the attribute name once instead of paying a
+        # string-keyed getattr lookup per task.
+        get = attrgetter(filter_by[0])
+        value = filter_by[1]
+        return [t for t in self.tasks if get(t) == value]
     
 
     def find_task(self, title: str) -> Optional[Task]:
@@ -104,9 +336,27 @@ class TaskManager:
         Returns:
             Task or None: The matching Task object, or None if not found.
         """
-        for task in self.tasks:
-            if task.title.lower() == title.lower():
-                return task
-        return None
+        return self._by_lower_title.get(title.lower())
+
+
+_shared_manager: Optional[TaskManager] = None
+
+
+def get_manager() -> TaskManager:
+    """
+    Return the process-wide TaskManager, creating it on first use.
+
+    The UI modules used to each build their own manager at import time,
+    parsing the task file once per module and leaving every module with a
+    divergent in-memory copy. Sharing one instance means one parse at
+    startup and a single source of truth for all menus.
+
+    Returns:
+        TaskManager: The shared manager backed by the default task file.
+    """
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = TaskManager()
+    return _shared_manager
 
 
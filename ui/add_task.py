@@ -4,11 +4,11 @@ from rich.panel import Panel
 from datetime import datetime
 
 from task import Task
-from task_manager import TaskManager
+from task_manager import get_manager
 from utils.helpers import clear_screen
 
 console = Console()
-manager = TaskManager()
+manager = get_manager()
 
 
 def add_task_interface() -> None:
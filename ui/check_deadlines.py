@@ -1,11 +1,13 @@
+from datetime import datetime
+
 from rich.console import Console
 from rich.panel import Panel
 from utils.helpers import clear_screen
 
-from task_manager import TaskManager
+from task_manager import get_manager
 
 console = Console()
-manager = TaskManager()
+manager = get_manager()
 
 def check_deadlines_interface() -> None:
     """
@@ -15,8 +17,16 @@ def check_deadlines_interface() -> None:
     clear_screen()
     console.print(Panel("[bold cyan]Checking Upcoming & Overdue Deadlines[/bold cyan]", border_style="cyan"))
 
-    due_soon = [t for t in manager.tasks if t.is_due_soon()]
-    overdue = [t for t in manager.tasks if t.is_overdue()]
+    # Compute the current date once and classify each task in a single pass
+    # over the list; due-soon and overdue are mutually exclusive, so one
+    # predicate check per task decides the bucket.
+    today = datetime.now().date()
+    due_soon, overdue = [], []
+    for t in manager.tasks:
+        if t.is_overdue(today):
+            overdue.append(t)
+        elif t.is_due_soon(1, today):
+            due_soon.append(t)
 
     if not due_soon and not overdue:
         console.print("[green]No tasks due soon or overdue.[/green]")
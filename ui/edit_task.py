@@ -5,7 +5,7 @@ from rich.prompt import Prompt
 from rich.panel import Panel
 
 from utils.helpers import clear_screen
-from task_manager import TaskManager
+from task_manager import get_manager
 
 console = Console()
 
@@ -14,7 +14,7 @@ def edit_task_details_interface() -> None:
     Interface for editing an existing task’s details.
     """
     clear_screen()
-    manager = TaskManager()
+    manager = get_manager()
 
     console.print(Panel("[bold cyan]Edit Task Details[/bold cyan]", border_style="cyan"))
 
@@ -37,14 +37,20 @@ def edit_task_details_interface() -> None:
     new_folder = Prompt.ask("New folder", default=task.folder or "")
     new_tags = Prompt.ask("New tags (comma-separated)", default=",".join(task.tags))
 
-    manager.edit_task(task.title, {
-        "title": new_title,
-        "description": new_desc,
-        "due_date": new_due,
-        "status": new_status,
-        "folder": new_folder,
-        "tags": [t.strip() for t in new_tags.split(",") if t.strip()]
-    })
+    try:
+        manager.edit_task(task.title, {
+            "title": new_title,
+            "description": new_desc,
+            "due_date": new_due,
+            "status": new_status,
+            "folder": new_folder,
+            "tags": [t.strip() for t in new_tags.split(",") if t.strip()]
+        })
+    except ValueError as e:
+        # Backend validation (bad due date, title collision); task unchanged
+        console.print(f"[red]{e}[/red]")
+        input("\nPress [Enter] to return...")
+        return
 
     console.print("[green]Task updated successfully![/green]")
     input("\nPress [Enter] to return...")
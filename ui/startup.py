@@ -1,3 +1,4 @@
+import os
 import time
 
 from rich.console import Console
@@ -8,37 +9,42 @@ from utils.helpers import clear_screen
 
 console = Console()
 
+# The banner text never changes, so render it once at import instead of
+# loading the figlet font and re-rendering on every launch of the screen.
+_BANNER = Figlet(font="standard").renderText("Task Manager")
+
 def show_startup() -> None:
     """
-    Displays the startup screen with an ASCII art banner and a loading animation.
+    Displays the startup screen with an ASCII art banner.
 
-    This function clears the screen, shows the program banner, displays
-    a short progress bar animation, and prepares the interface for the main menu.
+    This function clears the screen, shows the program banner, and prepares
+    the interface for the main menu. The old sleep-driven loading bar burned
+    about three real seconds per launch doing nothing, so it is now opt-in:
+    set PIXEL_TASK_SPLASH to get the full animation back.
     """
     clear_screen()
 
-    # Render the ASCII banner
-    f = Figlet(font="standard")
-    banner = f.renderText("Task Manager")
-    console.print(f"[bold cyan]{(banner)}[/bold cyan]")
+    # Show the pre-rendered ASCII banner
+    console.print(f"[bold cyan]{_BANNER}[/bold cyan]")
 
     # Welcome message
     console.print("[bold white]Welcome to your personal task dashboard![/bold white]")
     console.print("[green]Manage your work, deadlines, and focus with style.[/green]\n")
 
-    # Loading bar animation
-    with Progress(
-        TextColumn("[bold cyan]Loading...[/bold cyan]"),
-        BarColumn(bar_width=None),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console,
-        transient=True,  # hides after completion
-    ) as progress:
-        task = progress.add_task("Loading", total=100)
-        for _ in range(100):
-            time.sleep(0.02)
-            progress.update(task, advance=1)
-
-    console.print("[bold green]Ready! Launching main menu...[/bold green]")
-    time.sleep(1)
-    clear_screen()
+    if os.environ.get("PIXEL_TASK_SPLASH"):
+        # Loading bar animation, purely cosmetic
+        with Progress(
+            TextColumn("[bold cyan]Loading...[/bold cyan]"),
+            BarColumn(bar_width=None),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            console=console,
+            transient=True,  # hides after completion
+        ) as progress:
+            task = progress.add_task("Loading", total=100)
+            for _ in range(100):
+                time.sleep(0.02)
+                progress.update(task, advance=1)
+
+        console.print("[bold green]Ready! Launching main menu...[/bold green]")
+        time.sleep(1)
+        clear_screen()
@@ -7,10 +7,10 @@ from rich.prompt import Prompt
 
 from utils.helpers import clear_screen
 from ui.view_tasks import view_tasks_interface
-from task_manager import TaskManager
+from task_manager import get_manager
 
 console = Console()
-manager = TaskManager()
+manager = get_manager()
 def show_simple_task_list() -> None:
     """
     Display a simple list of all tasks with only title, due date, and status.
@@ -1,5 +1,5 @@
 from typing import Optional, Tuple, List
-from datetime import datetime
+from datetime import date
 
 from InquirerPy import inquirer
 
@@ -9,10 +9,10 @@ from rich.prompt import Prompt
 from rich.panel import Panel
 
 from utils.helpers import clear_screen
-from task_manager import TaskManager, Task
+from task_manager import get_manager, Task
 
 console = Console()
-manager = TaskManager()
+manager = get_manager()
 
 def view_tasks_interface() -> None:
     """
@@ -62,7 +62,9 @@ def view_tasks_interface() -> None:
     tasks = manager.view_tasks(filter_by)  # filter tasks if any
 
     if sort_order:  # sort if needed
-        tasks.sort(key=lambda t: datetime.strptime(t.due_date, "%Y-%m-%d"),
+        # Task caches the parsed due date, so the key is an attribute read
+        # instead of a strptime per comparison.
+        tasks.sort(key=lambda t: t.due if t.due is not None else date.max,
                 reverse=(sort_order == "desc"))
 
     if not tasks:
@@ -1,4 +1,6 @@
 # utils/background.py
+import os
+import sys
 import time
 import threading
 
@@ -6,28 +8,80 @@ from typing import Optional, Set
 from task_manager import TaskManager
 from .helpers import notify_due_tasks
 
+# macOS thread quality-of-service class (from <pthread/qos.h>).
+QOS_CLASS_UTILITY = 0x11
+
+
+def promote_to_utility_qos() -> None:
+    """
+    Raise the calling thread's macOS QoS class to UTILITY.
+
+    Python threads inherit the parent's QoS and often land in the
+    BACKGROUND class, which the scheduler throttles aggressively —
+    notifications could be delayed arbitrarily under load. UTILITY keeps
+    the notifier timely at a modest CPU priority. No-op off macOS or when
+    the syscall is unavailable.
+
+    Returns:
+        None
+    """
+    if sys.platform != "darwin":
+        return
+    try:
+        import ctypes
+        libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+        libsystem.pthread_set_qos_class_self_np(QOS_CLASS_UTILITY, 0)
+    except (OSError, AttributeError):
+        pass
+
 def start_background_notifier(
     manager: TaskManager,
     interval: int = 60,
-    stop_flag: Optional[threading.Event] = None
+    stop_flag: Optional[threading.Event] = None,
+    max_interval: int = 480
 ) -> None:
     """
     Continuously checks tasks in the TaskManager and sends notifications for overdue or
     soon-due tasks. Designed to be run in a background thread.
 
+    Quiet passes back the polling interval off exponentially (up to
+    max_interval); any pass that fires a notification resets it, so an idle
+    task list costs a fraction of the wakeups without delaying fresh alerts
+    by more than the current backoff window.
+
     Args:
         manager (TaskManager): Instance of TaskManager containing all tasks.
-        interval (int, optional): Number of seconds to wait between checks. Defaults to 60.
+        interval (int, optional): Base number of seconds to wait between checks.
+            Defaults to 60.
         stop_flag (Optional[threading.Event], optional): Thread-safe event to signal stopping
             the loop. If None, the loop runs indefinitely. Defaults to None.
+        max_interval (int, optional): Upper bound for the backed-off interval.
+            Defaults to 480.
 
     Returns:
         None
     """
+    if stop_flag is None:
+        stop_flag = threading.Event()
+
+    promote_to_utility_qos()
+
     notified: Set[str] = set()  # Keep track of tasks already notified
-    
-    while stop_flag is None or not stop_flag.is_set():
-        manager = TaskManager()
-        manager.load_tasks()
-        notify_due_tasks(manager, notified)
-        time.sleep(interval)
\ No newline at end of file
+    wait_time = interval
+    last_mtime: Optional[int] = None
+
+    while not stop_flag.is_set():
+        # Re-read the file only when it actually changed on disk; in steady
+        # state each pass costs one stat() instead of a full reload + parse.
+        try:
+            mtime = os.stat(manager.filepath).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != last_mtime:
+            manager = TaskManager(manager.filepath)
+            last_mtime = mtime
+        sent = notify_due_tasks(manager, notified)
+        wait_time = interval if sent else min(wait_time * 2, max_interval)
+        # Event.wait sleeps for the interval but wakes immediately when
+        # stop_flag is set, so shutdown no longer blocks for a full cycle.
+        stop_flag.wait(wait_time)
\ No newline at end of file
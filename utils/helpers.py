@@ -1,51 +1,88 @@
 import os
-import time
+import sys
 
+from datetime import date, datetime
 from typing import Optional, Set
+from task import Task
 from task_manager import TaskManager
-from notifier import send_notification
+from notifier import send_notification, send_notifications
 
 def back_to_desktop():
     os.system('osascript -e \'tell application "System Events" to set visible of every process whose visible is true and name is not "Finder" to false\'')
 
 
 def clear_screen():
-    # os.system('cls' if os.name == 'nt' else 'clear')  for other mac users
-    os.system('clear')
+    # Write the clear + home escape sequence directly instead of forking a
+    # /bin/clear process per menu transition. Works in any ANSI terminal,
+    # including Windows Terminal.
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 
-def notify_due_tasks(manager: TaskManager, notified: Optional[Set[str]] = None) -> None:
+def notify_due_tasks(manager: TaskManager, notified: Optional[Set[str]] = None) -> int:
     """
     Checks all tasks once and sends notifications for overdue or soon-due tasks.
-    
+
     Args:
         manager (TaskManager): The TaskManager instance containing all tasks.
         notified (Optional[Set[str]], optional): A set of task titles already notified
             to prevent duplicate notifications. If None, a new empty set is used.
 
     Returns:
-        None
+        int: The number of notifications sent this pass, so callers can adapt
+        their polling interval.
     """
     if notified is None:
         notified = set()
 
+    # Compute the current date once per scan instead of once per task check.
+    today = datetime.now().date()
+
+    # Collect everything first, then fire a single osascript invocation.
+    batch = []
+
     for task in manager.tasks:
-        if task.due_date and task.is_not_completed():
+        if task.due_date and task.status != Task.COMPLETED:
             # Notify overdue tasks
-            # Modification  if task.is_overdue() and task.title not in notified: 
-            if task.is_overdue():
-                send_notification(
+            # Modification  if task.is_overdue() and task.title not in notified:
+            if task.is_overdue(today):
+                batch.append((
                     "Overdue Task",
                     f"'{task.title}' is past due! ({task.due_date})"
-                )
+                ))
                 notified.add(task.title)
 
             # Notify tasks due soon (1 day before)
-            # Modification  elif task.is_due_soon(1) and task.title not in notified: 
-            elif task.is_due_soon(1):
-                send_notification(
+            # Modification  elif task.is_due_soon(1) and task.title not in notified:
+            elif task.is_due_soon(1, today):
+                batch.append((
                     "Task Reminder",
                     f"'{task.title}' is due tomorrow! ({task.due_date})"
-                )
-                notified.add(task.title) # This doen't have any affect now. 
-        time.sleep(5)
+                ))
+                notified.add(task.title) # This doen't have any affect now.
+
+    send_notifications(batch)
+    return len(batch)
+
+
+def next_due_date(manager: TaskManager, today: Optional[date] = None) -> Optional[date]:
+    """
+    Finds the earliest non-past due date among incomplete tasks.
+
+    Pollers can cache this to decide whether a scan can possibly produce a
+    notification before the date draws near.
+
+    Args:
+        manager (TaskManager): The TaskManager instance containing all tasks.
+        today (date, optional): Precomputed current date.
+
+    Returns:
+        Optional[date]: The earliest upcoming due date, or None if there is none.
+    """
+    if today is None:
+        today = datetime.now().date()
+    return min(
+        (t.due for t in manager.tasks
+         if t.due is not None and t.status != Task.COMPLETED and t.due >= today),
+        default=None
+    )